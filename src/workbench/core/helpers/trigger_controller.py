@@ -65,13 +65,14 @@ class TriggerController:
         if self.level > np.max(np.abs(active_channel_data)):
             return 0
 
-        # Trigger logic
-        data_diff = np.diff(active_channel_data, prepend=active_channel_data[0])
-        data_slope = (
-            (data_diff < 0) if self.slope == TriggerSlope.POSITIVE else (data_diff > 0)
-        )
-        trigger_idx = np.argmin(
-            np.abs(active_channel_data - self.level + data_slope * 10)
-        )
-
-        return int(trigger_idx)
+        # Trigger logic: closest sample to the level on the requested slope.
+        # Samples on the wrong slope are masked out instead of offset, so
+        # no float copy of the slope mask is needed.
+        residual = np.abs(active_channel_data - self.level)
+        if self.slope == TriggerSlope.POSITIVE:
+            wrong_slope = active_channel_data[1:] < active_channel_data[:-1]
+        else:
+            wrong_slope = active_channel_data[1:] > active_channel_data[:-1]
+        residual[1:][wrong_slope] = np.inf
+
+        return int(residual.argmin())
@@ -3,6 +3,9 @@ import uuid
 import numpy as np
 from typing import ClassVar
 
+_CH_FMT = "Channel %s, dtype: %s, unit: %s"
+
+
 class ChannelInfo:
     def __init__(self, name=None, dtype=np.float64, unit=None) -> None:
         if name is None:
@@ -13,7 +16,7 @@ class ChannelInfo:
         self.unit = unit
 
     def __str__(self) -> str:
-        return f"Channel {self.name}, dtype: {str(self.dtype)}, unit: {self.unit}"
+        return _CH_FMT % (self.name, self.dtype, self.unit)
 
 
 class MediaInfo:
@@ -47,5 +50,5 @@ class MediaInfo:
         )
         return (
             f"Media Name: {self.name}, samplerate: {self.samplerate}, blocksize: {self.blocksize}, metadata: {metadata_str}, channels:\n +- "
-            + "\n +- ".join(str(ch) for ch in self.channels)
+            + "\n +- ".join([str(ch) for ch in self.channels])
         )
@@ -33,12 +33,16 @@ class OutputPort(Port):
         # Notify owner about the connection
         connected_port = kwargs.get("connected_port")
         self.owner.on_connect(connected_port, self)
-        self.update_format(self.media_info)
+        # Share the current format with the new peer, if there is one yet
+        if self.media_info is not None:
+            self.format_signal.send(self, media_info=self.media_info)
 
     def send_data(self, data) -> None:
         self.data_signal.send(self, data=data)
 
     def update_format(self, media_info) -> None:
+        if media_info is self.media_info:
+            return
         self.media_info = media_info
         self.format_signal.send(self, media_info=self.media_info)
 
@@ -54,7 +58,7 @@ class InputPort(Port):
         if self._connected_port:
             self.disconnect()
 
-        LOGGER.info(f"Connecting Input Port {self} to {output_port}")
+        LOGGER.info("Connecting Input Port %s to %s", self, output_port)
 
         self._connected_port = output_port
         self._connected_port.data_signal.connect(self._on_data_received)
@@ -71,7 +75,7 @@ class InputPort(Port):
 
     def disconnect(self) -> None:
         if self._connected_port:
-            LOGGER.info(f"Disconnecting Input Port {self} from {self._connected_port}")
+            LOGGER.info("Disconnecting Input Port %s from %s", self, self._connected_port)
             self._connected_port.data_signal.disconnect(self._on_data_received)
             self._connected_port.format_signal.disconnect(self._on_format_received)
             self._connected_port = None
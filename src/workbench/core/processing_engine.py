@@ -1,11 +1,67 @@
+import functools
 import logging
+import numpy as np
+from typing import Callable
 from .base_blocks import Block
+from .media_info import MediaInfo, ChannelInfo
 from .helpers.registry import BLOCK_REGISTRY
 from enum import Enum
 
 LOGGER = logging.getLogger(__name__)
 
 
+def _ci_to_dict(ch: ChannelInfo) -> dict:
+    return {"name": ch.name, "dtype": str(ch.dtype), "unit": ch.unit}
+
+
+def _mi_to_dict(mi: MediaInfo) -> dict:
+    return {
+        "name": mi.name,
+        "samplerate": mi.samplerate,
+        "blocksize": mi.blocksize,
+        "metadata": mi.metadata,
+        "channels": [_ci_to_dict(ch) for ch in mi.channels],
+    }
+
+
+# Converters for property values that json can't handle as-is
+_SERIALIZERS: dict[type, Callable] = {
+    Enum: lambda v: v.value,
+    np.ndarray: lambda v: v.tolist(),
+    np.generic: lambda v: v.item(),
+    MediaInfo: _mi_to_dict,
+    ChannelInfo: _ci_to_dict,
+}
+
+# Serializable @property descriptors per block class
+_PROP_CACHE: dict[type, tuple[tuple[str, property], ...]] = {}
+
+
+@functools.cache
+def _serializer_for(value_type: type) -> Callable | None:
+    for t, fn in _SERIALIZERS.items():
+        if issubclass(value_type, t):
+            return fn
+    return None
+
+
+def _serializable_properties(cls: type) -> tuple[tuple[str, property], ...]:
+    props = _PROP_CACHE.get(cls)
+    if props is None:
+        found = {}
+        for base_cls in cls.__mro__:
+            for name, value in base_cls.__dict__.items():
+                if isinstance(value, property) and name not in found:
+                    found[name] = value
+        # Check if it's a property flagged as not_serializable
+        props = tuple(
+            (name, prop) for name, prop in found.items()
+            if not hasattr(prop.fget, "not_serializable")
+        )
+        _PROP_CACHE[cls] = props
+    return props
+
+
 class ProcessingEngine:
     def __init__(self) -> None:
         self._blocks = {}
@@ -14,11 +70,11 @@ class ProcessingEngine:
 
     def add_block(self, block: Block, block_id=None):
         if self._is_running:
-            LOGGER.error(f"Can not add block {block_id} while the engine is running")
+            LOGGER.error("Can not add block %s while the engine is running", block_id)
             return
 
         id = block_id if block_id is not None else block.id
-        LOGGER.debug(f"Adding block with id: {id}")
+        LOGGER.debug("Adding block with id: %s", id)
         self._blocks[block_id] = block
         if block.is_producer():
             self._producers.append(block)
@@ -26,24 +82,52 @@ class ProcessingEngine:
 
     def remove_block(self, block_id):
         if self._is_running:
-            LOGGER.error(f"Cannot remove block {block_id} while the engine is running.")
+            LOGGER.error("Cannot remove block %s while the engine is running.", block_id)
             return
 
         if block_id not in self._blocks:
-            LOGGER.error(f"Attempted to remove non-existent block {block_id}.")
+            LOGGER.error("Attempted to remove non-existent block %s.", block_id)
             return
 
-        LOGGER.debug(f"Removing block {block_id}")
+        LOGGER.debug("Removing block %s", block_id)
         block_to_remove = self._blocks.pop(block_id)
-
-        # Disconnect ports
-        for in_port in block_to_remove.get_input_ports():
-            block_to_remove.get_input_port(in_port).disconnect()
+        self._disconnect_inputs(block_to_remove)
 
         if block_to_remove.is_producer():
             # Also remove it from the list of producers
             self._producers.remove(block_to_remove)
 
+    def remove_blocks(self, block_ids):
+        """
+        Removes several blocks at once. The producers list is rebuilt a
+        single time instead of once per removed producer.
+        """
+        if self._is_running:
+            LOGGER.error("Cannot remove blocks while the engine is running.")
+            return
+
+        removed_producers = set()
+        for block_id in block_ids:
+            block = self._blocks.pop(block_id, None)
+            if block is None:
+                LOGGER.error("Attempted to remove non-existent block %s.", block_id)
+                continue
+
+            LOGGER.debug("Removing block %s", block_id)
+            self._disconnect_inputs(block)
+            if block.is_producer():
+                removed_producers.add(id(block))
+
+        if removed_producers:
+            self._producers = [
+                p for p in self._producers if id(p) not in removed_producers
+            ]
+
+    @staticmethod
+    def _disconnect_inputs(block):
+        for in_port in block.get_input_ports():
+            block.get_input_port(in_port).disconnect()
+
     def clear_all_blocks(self):
         """Removes all blocks from the engine."""
         if self._is_running:
@@ -52,15 +136,14 @@ class ProcessingEngine:
             
         LOGGER.debug("Clearing all blocks from engine.")
         # Iterate over a copy of the keys since we're modifying the dict
-        for block_id in list(self._blocks.keys()):
-            self.remove_block(block_id)
+        self.remove_blocks(list(self._blocks.keys()))
             
         self._blocks.clear()
         self._producers.clear()
         
     def get_block_by_id(self, block_id: str) -> Block | None:
         """Helper to safely get a block."""
-        LOGGER.debug(f"Searching for {block_id} in Blocks: {self._blocks.keys()}")
+        LOGGER.debug("Searching for %s in Blocks (%d)", block_id, len(self._blocks))
         return self._blocks.get(block_id)
 
     def _get_validated_ports(self, source_id, source_port, dest_id, dest_port):
@@ -74,13 +157,13 @@ class ProcessingEngine:
 
         if not out_block.is_output_port_valid(source_port):
             LOGGER.error(
-                f"Engine: Output port '{source_port}' not found at block '{source_id}'"
+                "Engine: Output port '%s' not found at block '%s'", source_port, source_id
             )
             return None, None
 
         if not in_block.is_input_port_valid(dest_port):
             LOGGER.error(
-                f"Engine: Input port '{dest_port}' not found at block '{dest_id}'"
+                "Engine: Input port '%s' not found at block '%s'", dest_port, dest_id
             )
             return None, None
 
@@ -98,10 +181,34 @@ class ProcessingEngine:
         )
         if in_port and out_port:
             LOGGER.debug(
-                f"Engine: Connecting '{source_id}:{source_port}' to '{dest_id}:{dest_port}'"
+                "Engine: Connecting '%s:%s' to '%s:%s'",
+                source_id, source_port, dest_id, dest_port,
             )
             in_port.connect(out_port)
 
+    def _bulk_connect(self, edges: list[tuple[str, str, str, str]]):
+        """
+        Connects a batch of (source_id, source_port, dest_id, dest_port) edges.
+        Ports are looked up directly; unknown blocks or ports are skipped with a warning.
+        """
+        if self._is_running:
+            LOGGER.error("Cannot change connections while engine is running.")
+            return
+
+        blocks = self._blocks
+        for source_id, source_port, dest_id, dest_port in edges:
+            try:
+                out_port = blocks[source_id]._output_ports[source_port]
+                in_port = blocks[dest_id]._input_ports[dest_port]
+            except KeyError as e:
+                LOGGER.warning(
+                    "Engine: Skipping connection '%s:%s' to '%s:%s', %s not found",
+                    source_id, source_port, dest_id, dest_port, e,
+                )
+                continue
+
+            in_port.connect(out_port)
+
     def disconnect_ports(self, source_id, source_port, dest_id, dest_port):
         if self._is_running:
             LOGGER.error("Cannot change connections while engine is running.")
@@ -112,7 +219,8 @@ class ProcessingEngine:
         )
         if in_port and out_port:
             LOGGER.debug(
-                f"Engine: Disconnecting '{source_id}:{source_port}' to '{dest_id}:{dest_port}'"
+                "Engine: Disconnecting '%s:%s' to '%s:%s'",
+                source_id, source_port, dest_id, dest_port,
             )
             in_port.disconnect()
 
@@ -141,25 +249,21 @@ class ProcessingEngine:
 
     def _get_block_properties(self, block) -> dict:
         """
-        Returns a list of all @property names defined in a class and its ancestors.
+        Returns a dict with the values of all serializable @property defined in
+        a block class and its ancestors.
         """
         properties = {}
-        cls = block.__class__
-        for base_cls in cls.__mro__:
-            for name, value in base_cls.__dict__.items():
-                if isinstance(value, property) and name not in properties:
-                    # Check if it's a property flagges as not_serializable
-                    if hasattr(value.fget, "not_serializable"):
-                        continue
-                    # Invoke the property getter
-                    prop_value = value.__get__(block, type(block))
-                    
-                    # If it's an Enum we serialize it's value
-                    if isinstance(prop_value, Enum):
-                        prop_value = prop_value.value
-                    
-                    # Add propery name and value
-                    properties[name] = prop_value
+        for name, prop in _serializable_properties(type(block)):
+            # Invoke the property getter
+            prop_value = prop.__get__(block, type(block))
+
+            # Convert values json can't handle (Enums, numpy types, ...)
+            serializer = _serializer_for(type(prop_value))
+            if serializer is not None:
+                prop_value = serializer(prop_value)
+
+            # Add propery name and value
+            properties[name] = prop_value
         return properties
 
     def serialize(self) -> dict:
@@ -195,7 +299,8 @@ class ProcessingEngine:
             "nodes": nodes_data,
             "connections": connections_data
         }
-        LOGGER.info(ser_obj)
+        if LOGGER.isEnabledFor(logging.INFO):
+            LOGGER.info(ser_obj)
         return ser_obj
     
     def deserialize(self, data: dict, blocks=True, connections=True):
@@ -216,14 +321,14 @@ class ProcessingEngine:
 
         if blocks:
             self.clear_all_blocks()
-            LOGGER.debug(f"Found {len(nodes_data)} blocks")
+            LOGGER.debug("Found %s blocks", len(nodes_data))
             # --- 1. Create all block instances ---
             for node_info in nodes_data:
                 block_type_str = node_info.get("type")
                 block_id = node_info.get("id")
                 properties = node_info.get("properties", {})
 
-                LOGGER.debug(f"Creating block. type: {block_type_str}, id: {block_id}, properties: {properties}")
+                LOGGER.debug("Creating block. type: %s, id: %s, properties: %s", block_type_str, block_id, properties)
                 
                 if not block_type_str or not block_id:
                     LOGGER.warning("Skipping invalid node data.")
@@ -236,7 +341,7 @@ class ProcessingEngine:
                         # Create the block (assumes 'name' is in properties)
                         block_name = properties.get("name", block_type_str)
                         block = block_class(name=block_name)
-                        LOGGER.debug(f"  block instance: {block} type: {type(block)}")
+                        LOGGER.debug("  block instance: %s type: %s", block, type(block))
                         
                         # Set all saved properties
                         for prop, val in properties.items():
@@ -245,18 +350,20 @@ class ProcessingEngine:
                         # Add to the engine
                         self.add_block(block, block_id)
                     except Exception as e:
-                        LOGGER.error(f"Failed to create block '{block_type_str}' (ID: {block_id}): {e}")
+                        LOGGER.error("Failed to create block '%s' (ID: %s): %s", block_type_str, block_id, e)
                 else:
-                    LOGGER.error(f"Unknown block type '{block_type_str}'. Not found in registry.")
+                    LOGGER.error("Unknown block type '%s'. Not found in registry.", block_type_str)
 
         if connections:
             # --- 2. Connect the blocks ---
-            for conn_info in connections_data:
-                self.connect_ports(
+            self._bulk_connect([
+                (
                     conn_info.get("from_node_id"),
                     conn_info.get("from_port"),
                     conn_info.get("to_node_id"),
                     conn_info.get("to_port"),
                 )
+                for conn_info in connections_data
+            ])
             
-        LOGGER.info(f"Deserialization complete. Loaded {len(self._blocks)} blocks.")
+        LOGGER.info("Deserialization complete. Loaded %s blocks.", len(self._blocks))
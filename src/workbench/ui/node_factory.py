@@ -8,6 +8,18 @@ from .views.widgets import ScopeWidget
 LOGGER = logging.getLogger(__name__)
 LOGGER.setLevel("DEBUG")
 
+# Node type identifier -> backend block class
+_MODEL_CLASSES = {
+    "AudioBlocks.SignalGeneratorNode": SignalGenerator,
+    "AudioBlocks.AudioCaptureNode": AudioCapture,
+    "AudioBlocks.ScopeNode": Scope,
+    "AudioBlocks.FFTAnalyzerNode": FFTAnalyzer,
+    "AudioBlocks.FrequencyResponseNode": FrequencyResponse,
+    "Utils.CurveSmootherNode": CurveSmoother,
+    "Utils.OctaveSmootherNode": OctaveSmoother,
+    "Utils.SpectralDenoiserNode": SpectralDenoiser,
+}
+
 class NodeFactory:
     def __init__(self, engine=None, dock_manager=None) -> None:
         LOGGER.debug("NodeFactory Created")
@@ -20,11 +32,15 @@ class NodeFactory:
         Called when the user drops a NEW node.
         Creates a FRESH Model and its ViewModel.
         """
-        name = kwargs.get("name", self._get_default_name(identifier))
+        name = kwargs.get("name")
+        if name is None:
+            name = self._get_default_name(identifier)
         id = kwargs.get("id", None)
 
-        LOGGER.info(f"Creating model and view-model for node: identifier: \
-            {identifier}, name: {name}, id: {id} ")
+        LOGGER.info(
+            "Creating model and view-model for node: identifier: %s, name: %s, id: %s",
+            identifier, name, id,
+        )
         
         if id is None:
             # 1. Create the fresh Backend Model
@@ -46,24 +62,10 @@ class NodeFactory:
         """
         Pure Model creation logic.
         """
-        if identifier == "AudioBlocks.SignalGeneratorNode":
-            return SignalGenerator(name=name)
-        elif identifier == "AudioBlocks.AudioCaptureNode":
-            return AudioCapture(name=name)
-        elif identifier == "AudioBlocks.ScopeNode":
-            return Scope(name=name)
-        elif identifier == "AudioBlocks.FFTAnalyzerNode":
-            return FFTAnalyzer(name=name)
-        elif identifier == "AudioBlocks.FrequencyResponseNode":
-            return FrequencyResponse(name=name)
-        elif identifier == "Utils.CurveSmootherNode":
-            return CurveSmoother(name=name)
-        elif identifier == "Utils.OctaveSmootherNode":
-            return OctaveSmoother(name=name)
-        elif identifier == "Utils.SpectralDenoiserNode":
-            return SpectralDenoiser(name=name)
-
-        return None
+        model_cls = _MODEL_CLASSES.get(identifier)
+        if model_cls is None:
+            return None
+        return model_cls(name=name)
 
     def _find_model_instance(self, id:str):
         """
@@ -90,7 +92,7 @@ class NodeFactory:
 
     def _create_scope_dock(self, title: str):
         """Helper to handle the complex Dock Manager logic."""
-        LOGGER.debug(f"Creating scope dock widget with title: {title}")
+        LOGGER.debug("Creating scope dock widget with title: %s", title)
         dock_widget = ScopeWidget(self._dock_manager, title=title)
         
         if self._dock_manager:
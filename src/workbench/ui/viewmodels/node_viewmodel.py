@@ -25,6 +25,11 @@ class NodeViewModel(QObject):
     def get_property(self, name):
         return getattr(self.model, name, None)
 
+    def get_properties_bulk(self, names):
+        """Returns a {name: value} dict for several model properties at once."""
+        model = self.model
+        return {name: getattr(model, name, None) for name in names}
+
     def update_property(self, name, value):
         # This logic remains the same: the View tells the ViewModel what happened.
         setattr(self.model, name, value)
@@ -1,6 +1,7 @@
 import logging
+from collections import OrderedDict
 import numpy as np
-from PySide6.QtCore import Signal, Slot
+from PySide6.QtCore import QTimer, Signal, Slot
 
 from workbench.contracts.enums import ScopeModes, TriggerSlope
 from workbench.core.blocks.scope_block import Scope
@@ -10,13 +11,23 @@ import traceback
 
 LOGGER = logging.getLogger(__name__)
 
+# Number of x-axis arrays kept around by each ScopeViewModel
+XAXIS_CACHE_SIZE = 8
+
+# Minimum time between two data updates pushed to the view (~60Hz)
+VIEW_UPDATE_INTERVAL_MS = 16
+
 
 class ScopeViewModel(NodeViewModel):
     view_input_format_changed = Signal(str, object)
-    view_data_received = Signal(str, object)
+    # port_name, x_data, y_data (channels x samples, C-contiguous rows)
+    view_data_received = Signal(str, object, object)
     view_vertical_range_changed = Signal(float, float)
     view_vertical_scale_mode_changed = Signal()
 
+    # Internal: asks the GUI thread to schedule a flush of the pending data
+    _flush_requested = Signal()
+
     def __init__(self, model: Scope, dock_widget):
         super().__init__(model)
 
@@ -25,6 +36,8 @@ class ScopeViewModel(NodeViewModel):
         self._dock_widget = dock_widget
 
         self._media_info = None
+        self._samplerate = 1.0
+        self._nyquist = 24000.0
 
         self.model.input_format_changed.connect(self.on_model_input_format_changed)
         self.model.data_received.connect(self.on_model_data_received)
@@ -36,61 +49,114 @@ class ScopeViewModel(NodeViewModel):
 
         self._dock_widget.bind_view_model(self)
 
-        self._last_data_length = 0
+        # (mode, data_len, rate) -> read-only x-axis array
+        self._xaxis_cache = OrderedDict()
+        # data_len -> read-only [0, 1] ramp, scaled to build each x-axis
+        self._unit_cache: dict[int, np.ndarray] = {}
         self._last_xdata = None
 
+        # Latest (port_name, x_data, y_data) not yet pushed to the view.
+        # Model data arrives on the producer thread, so only the GUI thread
+        # touches the timer; older frames are dropped if the view lags.
+        self._pending = None
+        self._flush_scheduled = False
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(VIEW_UPDATE_INTERVAL_MS)
+        self._flush_timer.timeout.connect(self._flush)
+        self._flush_requested.connect(self._flush_timer.start)
+
     def on_model_input_format_changed(self, sender, **kwargs):
         port_name = kwargs.get("port_name")
         media_info = kwargs.get("media_info")
 
         self._media_info = media_info
+        if media_info:
+            self._samplerate = float(media_info.samplerate)
+            self._nyquist = float(media_info.metadata.get('nyquist', 24000.0))
+        else:
+            self._samplerate = 1.0
+            self._nyquist = 24000.0
 
         self.view_input_format_changed.emit(port_name, media_info)
 
     def _generate_x_axis(self, data_len):
-
-        # Generate the corresponding time vector (x-axis)
-        if self.model.mode == ScopeModes.TIME:
-            duration = float(data_len - 1) / (
-                self._media_info.samplerate if self._media_info else 1
-            )
-            x_data = np.linspace(0, duration, num=data_len)
-            self._last_data_length = data_len
-        elif self.model.mode == ScopeModes.SPECTRUM:
-            nyquist = self._media_info.metadata.get('nyquist', 24000.0)
-            x_data = np.linspace(0, nyquist, num=data_len)
+        mode = self.model.mode
+        if mode == ScopeModes.TIME:
+            rate = self._samplerate
+        elif mode == ScopeModes.SPECTRUM:
+            rate = self._nyquist
         else:
-            LOGGER.error(f"{self.model.mode} NOT IMPLEMENTED!!!")
+            LOGGER.error(f"{mode} NOT IMPLEMENTED!!!")
+            return
 
+        key = (mode, data_len, rate)
+        x_data = self._xaxis_cache.get(key)
+        if x_data is None:
+            # Generate the corresponding x-axis
+            if mode == ScopeModes.TIME:
+                endpoint = float(data_len - 1) / rate
+            else:
+                endpoint = rate
+            x_data = self._unit_axis(data_len) * np.float32(endpoint)
+            # Shared by every payload, so nobody may modify it
+            x_data.setflags(write=False)
+
+            self._xaxis_cache[key] = x_data
+            if len(self._xaxis_cache) > XAXIS_CACHE_SIZE:
+                self._xaxis_cache.popitem(last=False)
+        else:
+            self._xaxis_cache.move_to_end(key)
 
         self._last_xdata = x_data
-        
+
+    def _unit_axis(self, data_len):
+        unit = self._unit_cache.get(data_len)
+        if unit is None:
+            unit = np.arange(data_len, dtype=np.float32)
+            if data_len > 1:
+                unit /= data_len - 1
+            unit.setflags(write=False)
+            self._unit_cache[data_len] = unit
+        return unit
 
     def on_model_data_received(self, sender, **kwargs):
         port_name = kwargs.get("port_name")
         data = kwargs.get("data")
-        data_len = len(data)
 
         # If we don't have any valid data we can't do anything
         if data is None:
             return
 
-        #LOGGER.info(f"port_name: {port_name}, data_len: {np.shape(data)}, data: {data}")
-        if self._last_data_length != data_len:
-            # Generate the corresponding time vector (x-axis)
-            #duration = float(data_len - 1) / (
-            #    self._media_info.samplerate if self._media_info else 1
-            #)
-            #x_data = np.linspace(0, duration, num=data_len)
-            #self._last_data_length = data_len
-            #self._last_xdata = x_data
-            self._generate_x_axis(data_len)
+        data_len = data.shape[0] if data.ndim else data.size
+
+        #LOGGER.info("port_name: %s, data_len: %s, data: %s", port_name, np.shape(data), data)
+        self._generate_x_axis(data_len)
 
-        # Prepare payload for sending to the view
-        payload = {"x_data": self._last_xdata, "y_data": data}
+        # The view plots one channel per curve, so hand it channel-major
+        # data where each y_data[ch] is a contiguous row. The copy is done
+        # here, on the producer thread, rather than on the GUI thread.
+        if data.ndim == 2:
+            y_data = np.ascontiguousarray(data.T)
+        else:
+            y_data = np.reshape(data, (1, -1))
+
+        # Keep only the most recent frame, the view is notified on the next flush
+        self._pending = (port_name, self._last_xdata, y_data)
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            self._flush_requested.emit()
+
+    @Slot()
+    def _flush(self):
+        # Clear the flag first so data arriving meanwhile schedules a new flush
+        self._flush_scheduled = False
+        pending, self._pending = self._pending, None
+        if pending is None:
+            return
 
         # Notify the view that we have new data to show
-        self.view_data_received.emit(port_name, payload)
+        self.view_data_received.emit(*pending)
 
     @Slot(float, float)
     def on_ycontroller_range_changed(self, sender, min, max):
@@ -104,5 +170,19 @@ class ScopeViewModel(NodeViewModel):
         self._dock_widget.toggleView(True)
 
     def cleanup(self):
+        # Stop listening to the model, it may outlive this view-model
+        self.model.input_format_changed.disconnect(self.on_model_input_format_changed)
+        self.model.data_received.disconnect(self.on_model_data_received)
+        self.model.vertical_range_changed.disconnect(self.on_ycontroller_range_changed)
+        self.model.vertical_scale_mode_changed.disconnect(
+            self.on_ycontroller_state_changed
+        )
+
+        self._flush_timer.stop()
+        self._pending = None
+        self._last_xdata = None
+        self._xaxis_cache.clear()
+        self._unit_cache.clear()
+
         LOGGER.debug("Cleaning up dock widget")
         self._dock_widget.deleteDockWidget()
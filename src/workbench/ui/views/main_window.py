@@ -1,4 +1,5 @@
 import base64
+import logging
 from ..theme import Theme
 from typing import cast
 from PySide6.QtCore import QByteArray
@@ -26,6 +27,8 @@ from .widgets.custom_dock_manager import CustomDockManager
 
 from .node_editor import NodeEditorWidget
 
+LOGGER = logging.getLogger(__name__)
+
 
 class MainWindow(FramelessMainWindow, CustomMainWindow):
     def __init__(self, parent=None):
@@ -141,11 +144,12 @@ class MainWindow(FramelessMainWindow, CustomMainWindow):
         self.setMinimumSize(800, 480)
 
     def create_simulation_toolbar(self):
-        icon = self.window().style().standardIcon(QStyle.StandardPixmap.SP_MediaPlay)
-        start_processing_action = QAction(icon, "Start Processing", self)
+        style = self.style()
+        play_icon = style.standardIcon(QStyle.StandardPixmap.SP_MediaPlay)
+        stop_icon = style.standardIcon(QStyle.StandardPixmap.SP_MediaStop)
+        start_processing_action = QAction(play_icon, "Start Processing", self)
         start_processing_action.triggered.connect(self.node_editor.start_processing)
-        icon = self.window().style().standardIcon(QStyle.StandardPixmap.SP_MediaStop)
-        stop_processing_action = QAction(icon, "Stop Processing", self)
+        stop_processing_action = QAction(stop_icon, "Stop Processing", self)
         stop_processing_action.triggered.connect(self.node_editor.stop_processing)
         self.toolBar.addSeparator()
         self.toolBar.addAction(start_processing_action)
@@ -237,31 +241,30 @@ class MainWindow(FramelessMainWindow, CustomMainWindow):
         self.node_editor.save_graph(file_path, main_window_data=main_window_data)
 
     def list_windows(self):
-        """Gets and prints the list of all top-level windows."""
+        """Logs the list of all floating dock windows (debug only)."""
+        if not LOGGER.isEnabledFor(logging.DEBUG):
+            return
+
         # Get the global QApplication instance
         app: QApplication = cast(QApplication, QApplication.instance())
 
-        print("\n--- Current Top-Level Windows ---")
+        LOGGER.debug("--- Current Top-Level Windows ---")
         # Get the list of all widgets with no parent
         top_level_windows = app.topLevelWidgets()
 
         if not top_level_windows:
-            print("No top-level windows found.")
+            LOGGER.debug("No top-level windows found.")
             return
 
         for i, window in enumerate(top_level_windows):
             if window.__class__.__name__ != "CFloatingDockContainer":
                 continue
 
-            window.show()
             # Check if the window is actually visible on screen
             visibility = "Visible" if window.isVisible() else "Hidden"
-            print(
-                f"{i + 1}: '{window.windowTitle()}' "
-                f"({window.__class__.__name__}) - {visibility}"
-                f"- {window.size()} - {window.geometry()}"
+            LOGGER.debug(
+                "%d: '%s' (%s) - %s - %s - %s",
+                i + 1, window.windowTitle(), window.__class__.__name__,
+                visibility, window.size(), window.geometry(),
             )
-        print("---------------------------------")
-
-
-
+        LOGGER.debug("---------------------------------")
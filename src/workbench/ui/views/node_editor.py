@@ -1,3 +1,4 @@
+import functools
 import logging
 import NodeGraphQt
 from NodeGraphQt.base.graph import NodeGraph
@@ -13,8 +14,6 @@ from PySide6.QtWidgets import (
 )
 from pathlib import Path
 
-import inspect
-
 from workbench.ui.views.widgets.enum_combo_box import EnumComboBox
 from workbench.ui.views.widgets.multiselect_list_widget import MultiSelectListWidget
 from . import nodes
@@ -25,15 +24,26 @@ LOGGER = logging.getLogger(__name__)
 BASE_PATH = Path(__file__).parent.resolve()
 
 
+# Optional node hooks, resolved once per node class
+@functools.lru_cache(maxsize=None)
+def _has_on_delete(cls) -> bool:
+    return callable(getattr(cls, "on_delete", None))
+
+
+@functools.lru_cache(maxsize=None)
+def _has_on_double_clicked(cls) -> bool:
+    return callable(getattr(cls, "on_double_clicked", None))
+
+
 class CustomNodeGraph(NodeGraph):
     def __init__(self, parent=None, **kwargs):
         super().__init__(parent, **kwargs)
 
     def delete_nodes(self, nodes, push_undo=True):
-        LOGGER.debug(f"Deleting {len(nodes)} nodes")
+        LOGGER.debug("Deleting %d nodes", len(nodes))
 
         for node in nodes:
-            if hasattr(node, "on_delete") and callable(getattr(node, "on_delete")):
+            if _has_on_delete(type(node)):
                 node.on_delete()
 
         super().delete_nodes(nodes, push_undo)
@@ -75,20 +85,9 @@ class NodeEditorWidget(QWidget):
         )
         self.properties_bin = properties_bin
 
-        # --- NEW, CORRECTED WORKAROUND ---
-        # Find the actual QTableWidget widget nested inside the properties bin
-        table_widget = properties_bin.findChild(QTableWidget)
-        if table_widget:
-            # Option A: Force a one-time resize of all rows.
-            # This should have a visible effect.
-            table_widget.resizeRowsToContents()
-
-            # Option B: A more robust alternative that makes resizing automatic.
-            # You can try this if Option A doesn't stick.
-            # vertical_header = table_widget.verticalHeader()
-            # vertical_header.setSectionResizeMode(QHeaderView.ResizeToContents)
-
-        # --- END WORKAROUND ---
+        # Keep the QTableWidget nested inside the properties bin, its rows
+        # are resized once a node actually populates them
+        self._props_table = properties_bin.findChild(QTableWidget)
 
         # Register and create some default nodes for testing
         self.register_default_nodes()
@@ -111,27 +110,36 @@ class NodeEditorWidget(QWidget):
         self.properties_bin.clear_bin()
         self._view_model.on_node_created(node)
         self.properties_bin.add_node(node)
+        self._resize_property_rows()
 
     def on_node_creation_error(self, msg, node):
         QMessageBox.critical(self, "Error Creating Node", msg)
         self.graph.delete_node(node)
 
     def on_nodes_deleted(self, node_ids):
-        LOGGER.debug(f"Nodes deleted: {node_ids}")
+        LOGGER.debug("Nodes deleted: %r", node_ids)
 
     def on_node_double_clicked(self, node):
-        LOGGER.debug(f"Node {node.name()} double clicked")
-        if hasattr(node, "on_double_clicked") and callable(
-            getattr(node, "on_double_clicked")
-        ):
+        LOGGER.debug("Node %s double clicked", node.name())
+        if _has_on_double_clicked(type(node)):
             node.on_double_clicked()
 
     def on_node_selection_changed(self, selected_nodes, unselected_nodes):
-        LOGGER.debug(f"selected: {selected_nodes}, unselected: {unselected_nodes}")
+        LOGGER.debug("selected: %r, unselected: %r", selected_nodes, unselected_nodes)
         for node in unselected_nodes:
             self.properties_bin.remove_node(node)
         for node in selected_nodes:
             self.properties_bin.add_node(node)
+        if selected_nodes:
+            self._resize_property_rows()
+
+    def _resize_property_rows(self):
+        table = self._props_table
+        if table is None:
+            # The bin may build its table lazily, look for it again
+            table = self._props_table = self.properties_bin.findChild(QTableWidget)
+        if table is not None:
+            table.resizeRowsToContents()
 
     def on_node_connected(self, input_port, output_port):
         """
@@ -171,10 +179,8 @@ class NodeEditorWidget(QWidget):
         # self.graph.register_node(NodeGraphQt.nodes.group_node.GroupNode)
 
         # Register custom nodes
-        for name, obj in inspect.getmembers(nodes):
-            if inspect.isclass(obj) and issubclass(obj, NodeGraphQt.BaseNode):
-                LOGGER.debug(f"Found class: {name}")
-                self.graph.register_node(obj)
+        for node_cls in nodes.NODE_CLASSES:
+            self.graph.register_node(node_cls)
         # self.graph.register_node(SignalGeneratorNode)
         # self.graph.register_node(MediaSourceNode)
         # self.graph.register_node(MediaProcessorNode)
@@ -7,6 +7,18 @@ from .curve_smoother_node import CurveSmootherNode
 from .octave_smoother_node import OctaveSmootherNode
 from .spectral_denoiser_node import SpectralDenoiserNode
 
+# Node classes registered in the node editor
+NODE_CLASSES = (
+    AudioCaptureNode,
+    ScopeNode,
+    SignalGeneratorNode,
+    FFTAnalyzerNode,
+    FrequencyResponseNode,
+    CurveSmootherNode,
+    OctaveSmootherNode,
+    SpectralDenoiserNode,
+)
+
 # Initialize a package-level variable
 NODES_VERSION = "1.0.0"
 
@@ -18,5 +30,6 @@ __all__ = ["AudioCaptureNode",
            "FrequencyResponseNode",
            "CurveSmootherNode",
            "OctaveSmootherNode",
-           "SpectralDenoiserNode"
+           "SpectralDenoiserNode",
+           "NODE_CLASSES",
            "NODES_VERSION"]
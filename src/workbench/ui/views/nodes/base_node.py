@@ -4,27 +4,19 @@ import NodeGraphQt
 
 LOGGER = logging.getLogger(__name__)
 
-LOGGER.setLevel("DEBUG")
-
-def mirror_ports(backend_class):
-    """
-    Decorator for Node Views.
-    Copies the port definitions from a Backend Block class.
-    """
-    def decorator(view_cls):
-        # Read metadata from the Backend Class
-        inputs = getattr(backend_class, '_meta_inputs', [])
-        outputs = getattr(backend_class, '_meta_outputs', [])
-
-        print(f"Found {len(inputs)} input ports. {inputs}")
-        print(f"Found {len(outputs)} outputs ports. {outputs}")
-        
-        # Set the static configuration on the View Class       
-        view_cls.INITIAL_INPUTS = list(inputs)
-        view_cls.INITIAL_OUTPUTS = list(outputs)
-
-        return view_cls
-    return decorator
+def _values_equal(a, b):
+    """Cheap equality check that never raises (e.g. for numpy arrays)."""
+    if a is b:
+        return True
+    if type(a) is not type(b):
+        return False
+    if type(a) is float:
+        # Values round-tripped through Qt spin boxes may differ by noise
+        return abs(a - b) <= 1e-12
+    try:
+        return bool(a == b)
+    except (TypeError, ValueError):
+        return False
 
 class BaseNode(NodeGraphQt.BaseNode):
     """
@@ -39,12 +31,86 @@ class BaseNode(NodeGraphQt.BaseNode):
 
     CUSTOM_PROPERTIES = {}
 
-    INITIAL_INPUTS = [] 
-    INITIAL_OUTPUTS = []
+    # Backend block class whose port definitions are mirrored by this view
+    BACKEND_CLASS = None
+
+    INITIAL_INPUTS = ()
+    INITIAL_OUTPUTS = ()
+
+    # name -> (items_source function, getter function), resolved per class
+    _PROPERTY_HOOKS = {}
+    # (name, default value, create_property kwargs), compiled per class
+    _PROPERTY_SPECS = ()
+
+    # node property -> view model property, for properties without a getter
+    _VM_PROPERTY_NAMES = {}
+
+    # Property names always created in __init__, so has_property can be skipped
+    _KNOWN_PROPERTIES = frozenset(("block_id",))
+
+    @staticmethod
+    def _compile_property_spec(config):
+        """Turns a CUSTOM_PROPERTIES entry into create_property arguments."""
+        # Extract config
+        default_value = config.get("default_value")
+        items = config.get("default_items", []) # Start with empty/default list
+
+        # Extra args for create_property
+        kwargs = {
+            "widget_type": config.get("widget_type"),
+            "widget_tooltip": config.get("widget_tooltip", ""),
+        }
+
+        # Add specific args based on type
+        if "range" in config:
+            kwargs["range"] = config["range"]
+        if items is not None:
+            kwargs["items"] = items
+        return default_value, kwargs
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        backend_class = cls.__dict__.get("BACKEND_CLASS")
+        if backend_class is not None:
+            # Copy the port definitions from the backend block
+            cls.INITIAL_INPUTS = tuple(getattr(backend_class, "_meta_inputs", ()))
+            cls.INITIAL_OUTPUTS = tuple(getattr(backend_class, "_meta_outputs", ()))
+            if LOGGER.isEnabledFor(logging.DEBUG):
+                LOGGER.debug(
+                    "%s mirrors %s: inputs %s, outputs %s",
+                    cls.__name__, backend_class.__name__,
+                    cls.INITIAL_INPUTS, cls.INITIAL_OUTPUTS,
+                )
+
+        hooks = {}
+        for name, config in cls.CUSTOM_PROPERTIES.items():
+            items_source = config.get("items_source")
+            getter = config.get("getter")
+            hooks[name] = (
+                getattr(cls, items_source, None) if items_source else None,
+                getattr(cls, getter, None) if getter else None,
+            )
+        cls._PROPERTY_HOOKS = hooks
+        cls._PROPERTY_SPECS = tuple(
+            (name, *cls._compile_property_spec(config))
+            for name, config in cls.CUSTOM_PROPERTIES.items()
+        )
+        cls._VM_PROPERTY_NAMES = {
+            name: config.get("model_property", name)
+            for name, config in cls.CUSTOM_PROPERTIES.items()
+            if not config.get("getter")
+        }
+        cls._KNOWN_PROPERTIES = frozenset(cls.CUSTOM_PROPERTIES) | {"block_id"}
 
     def __init__(self):
         super(BaseNode, self).__init__()
         self._view_model = None
+        # While syncing from the view model, config change notifications are
+        # collected here and emitted once the sync is done.
+        self._sync_in_progress = False
+        self._dirty_props = set()
+        # Last items pushed per property, to skip redundant widget refreshes
+        self._items_snapshot = {}
 
         self.create_property("block_id", "")
         self._initialize_custom_properties()
@@ -52,37 +118,17 @@ class BaseNode(NodeGraphQt.BaseNode):
         self._initialize_default_ports()
 
     def _initialize_custom_properties(self):
-        """Creates properties using defaults from the dictionary."""
-        for name, config in self.CUSTOM_PROPERTIES.items():
-            
-            # Extract config
-            default_value = config.get("default_value")
-            widget_type = config.get("widget_type")
-            tooltip = config.get("widget_tooltip", "")
-            items = config.get("default_items", []) # Start with empty/default list
-            
-            # Extra args for create_property
-            kwargs = {
-                "widget_type": widget_type,
-                "widget_tooltip": tooltip
-            }
-            
-            # Add specific args based on type
-            if "range" in config:
-                kwargs["range"] = config["range"]
-            if items is not None:
-                kwargs["items"] = items
-                
-            # Create it!
+        """Creates properties using the specs compiled for this class."""
+        for name, default_value, kwargs in self._PROPERTY_SPECS:
             self.create_property(name, value=default_value, **kwargs)
 
     def _initialize_default_ports(self):
         """Creates the static ports defined in the class."""
-        LOGGER.debug(f"Creating input ports: {self.INITIAL_INPUTS}")
+        LOGGER.debug("Creating input ports: %s", self.INITIAL_INPUTS)
         for name in self.INITIAL_INPUTS:
             self.add_input(name)
             
-        LOGGER.debug(f"Creating output ports: {self.INITIAL_OUTPUTS}")
+        LOGGER.debug("Creating output ports: %s", self.INITIAL_OUTPUTS)
         for name in self.INITIAL_OUTPUTS:
             self.add_output(name)
 
@@ -91,32 +137,29 @@ class BaseNode(NodeGraphQt.BaseNode):
         Updates property values and item lists from the ViewModel.
         """
         self._set_property_private("block_id", self.model.id)
-        for name, config in self.CUSTOM_PROPERTIES.items():
-            
+        hooks = self._PROPERTY_HOOKS
+        vm_names = self._VM_PROPERTY_NAMES
+        # Fetch every plain value from the view model in one call
+        vm_values = self._view_model.get_properties_bulk(vm_names.values())
+        for name in self.CUSTOM_PROPERTIES:
+            items_source, getter = hooks.get(name, (None, None))
+
             # 1. Update Items (Dynamic Lists)
-            # If the config has an "items_source" key, call that method on VM
-            items_source_name = config.get("items_source")
-            if items_source_name and hasattr(self, items_source_name):
-                # Call the method on the VM (e.g., vm.get_input_devices())
-                new_items = getattr(self, items_source_name)()
-                
+            # If the config has an "items_source" key, call that method
+            if items_source is not None:
+                # Call the method on the node (e.g., node._get_input_devices())
+                new_items = items_source(self)
+
                 # Update the widget
-                if hasattr(self.model, 'set_items'):
-                    self.model.set_items(name, new_items)
-                    
-                    # Update property definition internal storage if supported
-                    # self.set_property_items(name, new_items) # Hypothetical API
+                self._set_items(name, new_items)
 
             # 2. Update Value
             # We assume the property name in Node matches the property name in VM
             # or we can use a "model_property" key mapping.
-            current_value = None
-            getter = config.get("getter", None)
             if getter is not None:
-                current_value = getattr(self, getter)()
+                current_value = getter(self)
             else:
-                model_prop_name = config.get("model_property", name)
-                current_value = self._view_model.get_property(model_prop_name)
+                current_value = vm_values.get(vm_names[name])
             
             # Use your existing set_property logic (handles Enums, etc)
             # push_undo=False because this is a sync, not a user action
@@ -127,49 +170,114 @@ class BaseNode(NodeGraphQt.BaseNode):
         Ensures the View matches the Backend's ports.
         This is crucial for nodes that change ports dynamically (e.g., 'Add Channel').
         """
-        if not self._view_model:
+        # Set lookups keep this linear; the backend order is preserved
+        view_inputs = {p.name() for p in self.input_ports()}
+        missing_inputs = [
+            name for name in self._view_model.get_input_ports()
+            if name not in view_inputs
+        ]
+        view_outputs = {p.name() for p in self.output_ports()}
+        missing_outputs = [
+            name for name in self._view_model.get_output_ports()
+            if name not in view_outputs
+        ]
+        # Common case: the static ports already match the backend
+        if not missing_inputs and not missing_outputs:
             return
 
-        # 1. Sync Inputs
-        vm_inputs = self._view_model.get_input_ports() # List of strings
-        view_inputs = [p.name() for p in self.input_ports()]
-        
-        for name in vm_inputs:
-            if name not in view_inputs:
-                self.add_input(name)
-                
-        # 2. Sync Outputs
-        vm_outputs = self._view_model.get_output_ports() # List of strings
-        view_outputs = [p.name() for p in self.output_ports()]
-        
-        for name in vm_outputs:
-            if name not in view_outputs:
-                self.add_output(name)
+        for name in missing_inputs:
+            self.add_input(name)
+        for name in missing_outputs:
+            self.add_output(name)
 
     def _set_property_private(self, name, value, push_undo=False):
-        if self.has_property(name):
-            super().set_property(name, value, push_undo)
+        if name not in self._KNOWN_PROPERTIES and not self.has_property(name):
+            return
+        if _values_equal(self.get_property(name), value):
+            return
+        super().set_property(name, value, push_undo)
+
+    def _set_items(self, name, items):
+        """Pushes a new items list to the widget unless it is unchanged."""
+        snapshot = tuple(items)
+        if self._items_snapshot.get(name) == snapshot:
+            return
+        if hasattr(self.model, 'set_items'):
+            self._items_snapshot[name] = snapshot
+            self.model.set_items(name, items)
+            self._emit_property_cfg_changed(name)
+
+    def _emit_property_cfg_changed(self, name):
+        """Notifies the graph that a property's items/range changed."""
+        if self._sync_in_progress:
+            self._dirty_props.add(name)
+        elif self.graph:
+            self.graph.property_cfg_changed.emit(self, name)
+
+    def _flush_dirty_props(self):
+        dirty, self._dirty_props = self._dirty_props, set()
+        if self.graph:
+            for name in dirty:
+                self.graph.property_cfg_changed.emit(self, name)
+
+    def _sync_all(self):
+        """
+        Syncs properties and ports from the ViewModel in one pass, emitting
+        the collected config change notifications only at the end.
+        """
+        if not self._view_model:
+            return
+
+        self._sync_in_progress = True
+        try:
+            self._sync_properties()
+            self._sync_ports()
+        finally:
+            self._sync_in_progress = False
+        self._flush_dirty_props()
 
     def bind_view_model(self, view_model):
+        # Binding the same view model twice would stack up connections
+        if view_model is self._view_model:
+            return
+        self.unbind_view_model()
+
         self._view_model = view_model
         self._view_model.view_property_changed.connect(
             self.on_view_model_property_changed
         )
-        self._sync_properties()
-        self._sync_ports()
+        self._sync_all()
+
+    def unbind_view_model(self):
+        if self._view_model is None:
+            return
+        try:
+            self._view_model.view_property_changed.disconnect(
+                self.on_view_model_property_changed
+            )
+        except (RuntimeError, TypeError):
+            # Already disconnected, or the view model is being destroyed
+            pass
+        self._view_model = None
+        self._items_snapshot.clear()
 
     def get_view_model(self):
         return self._view_model
 
     def set_property(self, name, value, push_undo=True):
-        LOGGER.info(f"set_property: {name}, {value}")
+        LOGGER.debug("set_property: %s, %s", name, value)
+
+        # Nothing to store or forward if the value didn't change
+        if _values_equal(self.get_property(name), value):
+            return
 
         self._set_property_private(name, value, push_undo)
-        if self._view_model:
+        # Don't echo values back to the view model while syncing from it
+        if self._view_model and not self._sync_in_progress:
             self._view_model.update_property(name, value)
 
     def on_view_model_property_changed(self, name, value):
-        if self.has_property(name):
-            super().set_property(name, value, push_undo=False)
+        # Skips the update (and its redraw) when the value is unchanged
+        self._set_property_private(name, value)
 
 
@@ -1,14 +1,12 @@
 import logging
 
-import NodeGraphQt
 from NodeGraphQt.base.node import NodePropWidgetEnum
 
-from .base_node import mirror_ports, BaseNode
+from .base_node import BaseNode
 from workbench.core.blocks.curve_smoother import CurveSmoother
 
 LOGGER = logging.getLogger(__name__)
 
-@mirror_ports(CurveSmoother)
 class CurveSmootherNode(BaseNode):
     """
     A node for representing a CurveSmoother block.
@@ -20,6 +18,8 @@ class CurveSmootherNode(BaseNode):
     # Set the default node name.
     NODE_NAME = "CurveSmoother"
 
+    BACKEND_CLASS = CurveSmoother
+
     CUSTOM_PROPERTIES = {
         "smoothness": {
             "range": (0.1, 500.0),
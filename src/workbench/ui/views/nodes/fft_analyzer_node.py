@@ -1,14 +1,12 @@
 import logging
 
-import NodeGraphQt
 from NodeGraphQt.base.node import NodePropWidgetEnum
-from .base_node import mirror_ports, BaseNode
+from .base_node import BaseNode
 from workbench.core.blocks.fft_analyzer import FFTAnalyzer
 from workbench.contracts.enums import FFTWindow
 
 LOGGER = logging.getLogger(__name__)
 
-@mirror_ports(FFTAnalyzer)
 class FFTAnalyzerNode(BaseNode):
     """
     A node for representing a FFTAnalyzer.
@@ -20,6 +18,8 @@ class FFTAnalyzerNode(BaseNode):
     # Set the default node name.
     NODE_NAME = "FFT Analyzer"
 
+    BACKEND_CLASS = FFTAnalyzer
+
     CUSTOM_PROPERTIES = {
         "fft_size": {
             "range": (2048, 48000),
@@ -1,15 +1,13 @@
 import logging
 
-import NodeGraphQt
 from NodeGraphQt.base.node import NodePropWidgetEnum
 
 from workbench.core.blocks.frequency_response import FrequencyResponse
 from workbench.contracts.enums import FrequencyResponseMode
-from .base_node import mirror_ports, BaseNode
+from .base_node import BaseNode
 
 LOGGER = logging.getLogger(__name__)
 
-@mirror_ports(FrequencyResponse)
 class FrequencyResponseNode(BaseNode):
     """
     A node for representing a FrequencyResponse block.
@@ -21,6 +19,8 @@ class FrequencyResponseNode(BaseNode):
     # Set the default node name.
     NODE_NAME = "Frequency Response"
 
+    BACKEND_CLASS = FrequencyResponse
+
     CUSTOM_PROPERTIES = {
         "mode": {
             "default_value": "",
@@ -1,12 +1,14 @@
+import contextlib
 import logging
-import json
+import os
+
+import orjson
 from PySide6.QtCore import QObject, Signal, QByteArray
 
 from workbench.core.processing_engine import ProcessingEngine
 from ...node_factory import NodeFactory
 
 LOGGER = logging.getLogger(__name__)
-LOGGER.setLevel("DEBUG")
 
 class NodeEditorViewModel(QObject):
     engine_state_changed = Signal(bool)  # True if running, False if stopped
@@ -28,11 +30,12 @@ class NodeEditorViewModel(QObject):
         self.engine.stop()
         self.engine_state_changed.emit(False)
 
-    def save_graph(self, file_path, main_window_data=None):
+    def save_graph(self, file_path, main_window_data=None, pretty=False):
         """
         Orchestrates saving: merges Backend logic with Frontend layout.
+        Output is compact unless pretty=True is requested (e.g. for export).
         """
-        LOGGER.info(f"Saving session to {file_path}")
+        LOGGER.info("Saving session to %s", file_path)
         
         try:
             # 1. Serialize Backend (Models & Logic)
@@ -42,8 +45,12 @@ class NodeEditorViewModel(QObject):
             frontend_data = self.graph_view.serialize_session()
 
             # 3. Serialize window docking manager state
-            dock_manager_data = self.dock_manager.saveState().data().decode("utf-8")
-            LOGGER.debug(f"dock_manager_data: {dock_manager_data}")
+            # The state is binary when compression is enabled, so store it
+            # as base64 (ASCII) instead of decoding it as UTF-8 text.
+            dock_manager_data = (
+                self.dock_manager.saveState().toBase64().data().decode("ascii")
+            )
+            LOGGER.debug("dock_manager_data: %s", dock_manager_data)
 
             
 
@@ -57,11 +64,27 @@ class NodeEditorViewModel(QObject):
             }
             
             # 4. Write to disk
-            with open(file_path, 'w') as f:
-                json.dump(full_session_data, f, indent=2)
+            options = orjson.OPT_SERIALIZE_NUMPY
+            if pretty:
+                options |= orjson.OPT_INDENT_2
+            # Write next to the target and swap it in, so a failed save
+            # never leaves a truncated session behind
+            payload = orjson.dumps(full_session_data, option=options)
+            tmp_path = f"{file_path}.tmp"
+            try:
+                with open(tmp_path, 'wb') as f:
+                    f.write(payload)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp_path, file_path)
+            except BaseException:
+                # Don't leave a stray temp file behind a failed save
+                with contextlib.suppress(FileNotFoundError):
+                    os.unlink(tmp_path)
+                raise
                 
         except Exception as e:
-            LOGGER.error(f"Failed to save session: {e}")
+            LOGGER.error("Failed to save session: %s", e)
         #dic = self.engine.serialize()
         #self.engine.deserialize(dic)
     
@@ -69,11 +92,11 @@ class NodeEditorViewModel(QObject):
         """
         Orchestrates loading: Restores Backend first, then attaches Frontend.
         """
-        LOGGER.info(f"Loading session from {file_path}")
+        LOGGER.info("Loading session from %s", file_path)
         
         try:
-            with open(file_path, 'r') as f:
-                data = json.load(f)
+            with open(file_path, 'rb') as f:
+                data = orjson.loads(f.read())
             
             # 1. Clear everything
             self.engine.clear_all_blocks()
@@ -96,30 +119,40 @@ class NodeEditorViewModel(QObject):
             self.engine.deserialize(backend_data, blocks=False)
            
             # 6. Restore docking window manager state
-            dock_manager_data = QByteArray(data.get("dock_manager"))
-            self.dock_manager.restoreState(dock_manager_data)
+            dock_manager_data = data.get("dock_manager") or ""
+            if dock_manager_data.startswith("<"):
+                # Older sessions stored the uncompressed XML state as text
+                dock_state = QByteArray(dock_manager_data.encode("utf-8"))
+            else:
+                dock_state = QByteArray.fromBase64(dock_manager_data.encode("ascii"))
+            self.dock_manager.restoreState(dock_state)
 
             LOGGER.info("Session loaded successfully.")
 
             return data.get("main_window_data", {})
             
         except Exception as e:
-            LOGGER.error(f"Failed to load session: {e}")
+            LOGGER.error("Failed to load session: %s", e)
             # Optional: Cleanup/Reset on failure
 
 
     def bind_view_models(self):
         LOGGER.info("Binding models and view-models")
-        LOGGER.debug(f"nodes: {self.graph_view.all_nodes()}")
-        for node in self.graph_view.all_nodes():
-            block_id = node.get_property("block_id")
-            #node.model.id = block_id
-            model, view_model = self.factory.create_backend(node.type_, id=block_id, name=node.name())
+        nodes = self.graph_view.all_nodes()
+        LOGGER.debug("nodes: %s", nodes)
+        # Read everything needed from the nodes up front, then bind
+        bindings = [
+            (node, node.get_property("block_id"), node.type_, node.name())
+            for node in nodes
+        ]
+        create_backend = self.factory.create_backend
+        for node, block_id, node_type, name in bindings:
+            _, view_model = create_backend(node_type, id=block_id, name=name)
             node.bind_view_model(view_model)
 
     # --- Slots for NodeGraphQt signals ---
     def on_node_created(self, node):
-        LOGGER.info(f"Adding node '{node}' to engine")
+        LOGGER.info("Adding node '%s' to engine", node)
         try:
             model, view_model = self.factory.create_backend(node.type_, name=node.name())
             self.engine.add_block(model, node.id)
@@ -145,5 +178,4 @@ class NodeEditorViewModel(QObject):
 
     def on_nodes_deleted(self, node_ids):
         # This signal gives a list of IDs, perfect for the engine
-        for node_id in node_ids:
-            self.engine.remove_block(node_id)
+        self.engine.remove_blocks(node_ids)
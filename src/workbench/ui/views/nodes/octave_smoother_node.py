@@ -1,13 +1,14 @@
 from workbench.core.blocks.octave_smoother import OctaveSmoother
-from .base_node import mirror_ports, BaseNode
+from .base_node import BaseNode
 from NodeGraphQt.constants import NodePropWidgetEnum
 
-@mirror_ports(OctaveSmoother)
 class OctaveSmootherNode(BaseNode):
     
     __identifier__ = "Utils"
     NODE_NAME = "Octave Smoother"
 
+    BACKEND_CLASS = OctaveSmoother
+
     CUSTOM_PROPERTIES = {
         "bandwidth": {
             "default_value": 0.33, # 1/3 Octave
@@ -1,16 +1,14 @@
 import logging
 
-import NodeGraphQt
 from NodeGraphQt.base.node import NodePropWidgetEnum
 
-from .base_node import mirror_ports, BaseNode
+from .base_node import BaseNode
 from workbench.contracts.enums import SignalType
 from workbench.core.blocks import SignalGenerator
 
 
 LOGGER = logging.getLogger(__name__)
 
-@mirror_ports(SignalGenerator)
 class SignalGeneratorNode(BaseNode):
     """
     A node for representing an Audio Signal Generator.
@@ -22,6 +20,8 @@ class SignalGeneratorNode(BaseNode):
     # Set the default node name.
     NODE_NAME = "Signal Generator"
 
+    BACKEND_CLASS = SignalGenerator
+
     CUSTOM_PROPERTIES = {
         "signal_type": {
             "default_value": "",
@@ -1,13 +1,14 @@
 from workbench.core.blocks.spectral_denoiser import SpectralDenoiser
-from .base_node import mirror_ports, BaseNode
+from .base_node import BaseNode
 from NodeGraphQt.constants import NodePropWidgetEnum
 
-@mirror_ports(SpectralDenoiser)
 class SpectralDenoiserNode(BaseNode):
     
     __identifier__ = "Utils"
     NODE_NAME = "Spectral Denoiser"
 
+    BACKEND_CLASS = SpectralDenoiser
+
     CUSTOM_PROPERTIES = {
         "strength": {
             "default_value": 5,
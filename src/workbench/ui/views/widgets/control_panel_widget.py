@@ -1,5 +1,5 @@
 from PySide6.QtCore import Qt
-from PySide6.QtWidgets import QHBoxLayout, QVBoxLayout, QWidget
+from PySide6.QtWidgets import QBoxLayout, QWidget
 
 
 class ControlPanelWidget(QWidget):
@@ -10,9 +10,16 @@ class ControlPanelWidget(QWidget):
         # Store a list of the widgets we need to manage
         self.widgets = []
 
+        # A single box layout whose direction is flipped on orientation
+        # changes, so the control widgets are never reparented
+        self._layout = QBoxLayout(QBoxLayout.Direction.LeftToRight, self)
+        self._layout.addStretch()
+
     def addControlWidget(self, widget):
         """Adds a control widget to be managed by this panel's layout."""
         self.widgets.append(widget)
+        # Insert before the trailing stretch
+        self._layout.insertWidget(self._layout.count() - 1, widget)
 
     def setOrientation(self, orientation):
         """
@@ -21,29 +28,13 @@ class ControlPanelWidget(QWidget):
         Args:
             orientation (Qt.Orientation): The new orientation.
         """
-        # Only rebuild the layout if the orientation has changed
+        # Only touch the layout if the orientation has changed
         if orientation == self.current_orientation:
             return
 
         self.current_orientation = orientation
 
-        # If a layout already exists, delete it
-        if self.layout() is not None:
-            # Clear all items from the layout before deleting it
-            while self.layout().count():
-                item = self.layout().takeAt(0)
-                # Important: check if it's a widget before deleting
-                if item.widget():
-                    item.widget().setParent(None)
-            QWidget().setLayout(self.layout())  # Properly delete old layout
-
-        # Create the new layout based on the orientation
         if orientation == Qt.Orientation.Horizontal:
-            new_layout = QHBoxLayout(self)
+            self._layout.setDirection(QBoxLayout.Direction.LeftToRight)
         else:  # Vertical
-            new_layout = QVBoxLayout(self)
-
-        # Add all the stored widgets to the new layout
-        for widget in self.widgets:
-            new_layout.addWidget(widget)
-        new_layout.addStretch()
+            self._layout.setDirection(QBoxLayout.Direction.TopToBottom)
@@ -22,6 +22,13 @@ class CursorAwareDoubleSpinBox(QDoubleSpinBox):
         text_len = len(text)
         cursor_pos = line_edit.cursorPosition()
 
+        # Scan the text once for the sign and the decimal point
+        minus_pos = text.find("-")
+        decimal_point_pos = text.find(".")
+        if decimal_point_pos < 0:
+            # If no decimal point, treat it as being at the end
+            decimal_point_pos = text_len
+
         # if the cursor is at the begining of the value
         # we move one position to the right to not
         # create a new digit
@@ -32,17 +39,10 @@ class CursorAwareDoubleSpinBox(QDoubleSpinBox):
         # if the cursor is just before the minu sign
         # we move one position to the right to not break
         # the number
-        if (text.find("-") + 1) == cursor_pos:
+        if (minus_pos + 1) == cursor_pos:
             cursor_pos += 1
             line_edit.setCursorPosition(cursor_pos)
 
-        # Find the position of the decimal point
-        try:
-            decimal_point_pos = text.index(".")
-        except ValueError:
-            # If no decimal point, treat it as being at the end
-            decimal_point_pos = len(text)
-
         # Calculate the power of 10 based on cursor position
         if cursor_pos > decimal_point_pos:
             # Cursor is in the fractional part
@@ -51,16 +51,12 @@ class CursorAwareDoubleSpinBox(QDoubleSpinBox):
             # Cursor is in the integer part
             exponent = decimal_point_pos - cursor_pos
 
-        # Calculate the dynamic step value
-        dynamic_step = 10**exponent
-
-        # Call the original stepBy method with our dynamic step
-        # We multiply our dynamic_step by the original singleStep() to
-        # allow for fractional base steps if needed (e.g., 0.5, 0.2).
-        # For a pure 1, 10, 100 step, you could just use dynamic_step.
-        self.setSingleStep(dynamic_step)
+        # Call the original stepBy method with our dynamic step. The step is
+        # compared against the widget's own value, since callers may change
+        # it with setSingleStep() at any time.
+        step = 10**exponent
+        if self.singleStep() != step:
+            self.setSingleStep(step)
         super().stepBy(steps)
-        # Restore a default step if desired
-        self.setSingleStep(0.01)
         cursor_pos += len(line_edit.text()) - text_len
         line_edit.setCursorPosition(cursor_pos)
@@ -1,5 +1,5 @@
-from functools import partial
 import logging
+from PySide6.QtCore import Slot
 from PySide6.QtGui import Qt
 from PySide6.QtWidgets import QLabel, QWidget
 import PySide6QtAds as QtAds
@@ -8,6 +8,27 @@ from .custom_title_bar import CustomTitleBar
 
 LOGGER = logging.getLogger(__name__)
 
+_DOCK_FEATURE = QtAds.CDockWidget.DockWidgetFeature
+_FEATURE_NO_TAB = _DOCK_FEATURE.NoTab
+_FEATURE_DELETE_ON_CLOSE = _DOCK_FEATURE.DockWidgetDeleteOnClose
+_FEATURE_CUSTOM_CLOSE = _DOCK_FEATURE.CustomCloseHandling
+_CENTER_AREA = QtAds.DockWidgetArea.CenterDockWidgetArea
+# Dock widgets all live on the GUI thread, so skip the auto-connection check
+_DIRECT = Qt.ConnectionType.DirectConnection
+
+# Window flags for floating containers (frameless, with our own title bar)
+_FLOATING_FLAGS = (
+    Qt.WindowType.Window
+    | Qt.WindowType.WindowMinMaxButtonsHint
+    | Qt.WindowType.FramelessWindowHint
+)
+_FLOATING_FLAGS_NATIVE = (
+    Qt.WindowType.Window
+    | Qt.WindowType.WindowMaximizeButtonHint
+    | Qt.WindowType.CustomizeWindowHint
+    | Qt.WindowType.WindowCloseButtonHint
+)
+
 
 class CustomDockManager(QtAds.CDockManager):
     def __init__(self, parent=None) -> None:
@@ -16,38 +37,38 @@ class CustomDockManager(QtAds.CDockManager):
         # won't be applied
         self.setStyleSheet("")
 
-        self.floatingWidgetCreated.connect(self._on_floating_widget_created)
+        self.floatingWidgetCreated.connect(
+            self._on_floating_widget_created, _DIRECT
+        )
 
+    @Slot(QtAds.CFloatingDockContainer)
     def _on_floating_widget_created2(self, floating_widget):
         LOGGER.debug("floating window created")
         floating_widget.setTitleBarWidget(QWidget())
-        floating_widget.setWindowFlags(
-            Qt.WindowType.Window
-            | Qt.WindowType.WindowMaximizeButtonHint
-            | Qt.WindowType.CustomizeWindowHint
-            | Qt.WindowType.WindowCloseButtonHint
-        )
+        floating_widget.setWindowFlags(_FLOATING_FLAGS_NATIVE)
 
         floating_widget.setParent(None)
         floating_widget.setStyleSheet(self.styleSheet())
 
+    @Slot(QtAds.CFloatingDockContainer)
     def _on_floating_widget_created(self, floating_widget):
         LOGGER.debug("floating window created")
         floating_widget.setTitleBarWidget(CustomTitleBar(floating_widget))
-        floating_widget.setWindowFlags(
-            Qt.WindowType.Window
-            | Qt.WindowType.WindowMinMaxButtonsHint
-            | Qt.WindowType.FramelessWindowHint
-        )
+        floating_widget.setWindowFlags(_FLOATING_FLAGS)
         floating_widget.setMouseTracking(True)
         floating_widget.setParent(None)
         floating_widget.setStyleSheet(self.styleSheet())
 
     def addDockWidget(self, area, widget, area_widget=None, index=-1):
-        widget.topLevelChanged.connect(partial(self._on_top_level_changed, widget))
+        # Widgets can be re-added (e.g. after being closed); connect only once
+        if not widget.property("_top_level_tracked"):
+            widget.setProperty("_top_level_tracked", True)
+            widget.topLevelChanged.connect(self._on_top_level_changed, _DIRECT)
         super().addDockWidget(area, widget, area_widget, index)
 
-    def _on_top_level_changed(self, widget, top_level):
+    @Slot(bool)
+    def _on_top_level_changed(self, top_level):
+        widget = self.sender()
         LOGGER.debug(f"{widget}: top_level = {top_level}")
         if not top_level:
             return
@@ -59,31 +80,37 @@ class CustomDockManager(QtAds.CDockManager):
         area = widget.dockAreaWidget()
         p = QtAds.CDockWidget(self, "dummy_widget")
         p.setWidget(QLabel("Dummy Widget"))
-        p.setFeature(QtAds.CDockWidget.DockWidgetFeature.NoTab, True)
-        p.setFeature(
-            QtAds.CDockWidget.DockWidgetFeature.DockWidgetDeleteOnClose,
-            True,
-        )
-        p.setFeature(QtAds.CDockWidget.DockWidgetFeature.CustomCloseHandling, True)
-        widget.dockContainer().addDockWidget(
-            QtAds.DockWidgetArea.CenterDockWidgetArea, p, area
-        )
+        p.setFeature(_FEATURE_NO_TAB, True)
+        p.setFeature(_FEATURE_DELETE_ON_CLOSE, True)
+        p.setFeature(_FEATURE_CUSTOM_CLOSE, True)
+        widget.dockContainer().addDockWidget(_CENTER_AREA, p, area)
         area.setCurrentDockWidget(widget)
-        p.topLevelChanged.connect(partial(self._on_top_level_changed, p))
-        p.visibilityChanged.connect(partial(self._on_visibility_changed, p))
-        p.closeRequested.connect(partial(self._on_close_requested, p))
-        p.closed.connect(partial(self._on_closed, p))
+        p.topLevelChanged.connect(self._on_top_level_changed, _DIRECT)
+        p.visibilityChanged.connect(self._on_visibility_changed, _DIRECT)
+        p.closeRequested.connect(self._on_close_requested, _DIRECT)
+        p.closed.connect(self._on_closed, _DIRECT)
 
         LOGGER.debug(f"{p} created")
 
-    def _on_close_requested(self, widget):
+    @Slot()
+    def _on_close_requested(self):
+        widget = self.sender()
         LOGGER.debug(f"{widget}: close requested")
         widget.closeDockWidget()
 
-    def _on_closed(self, widget):
+    @Slot()
+    def _on_closed(self):
+        widget = self.sender()
         LOGGER.debug(f"{widget}: closed")
-
-    def _on_visibility_changed(self, dock_widget, visible):
+        # Release the dummy widget's connections as soon as it closes
+        widget.topLevelChanged.disconnect(self._on_top_level_changed)
+        widget.visibilityChanged.disconnect(self._on_visibility_changed)
+        widget.closeRequested.disconnect(self._on_close_requested)
+        widget.closed.disconnect(self._on_closed)
+
+    @Slot(bool)
+    def _on_visibility_changed(self, visible):
+        dock_widget = self.sender()
         areas = -1
         open_widgets = -1
         container = dock_widget.dockContainer()
@@ -53,29 +53,40 @@ class CustomMainWindow(QMainWindow):
         LOGGER.debug(f"setCentralWidget(): {widget}")
         central_layout = self._central_widget_container.layout()
         if central_layout:
-            central_layout.removeWidget(self._central_widget)
-            central_layout.addWidget(widget)
-            self._central_widget = widget
+            # Swap the widgets with a single repaint at the end
+            container = self._central_widget_container
+            container.setUpdatesEnabled(False)
+            try:
+                central_layout.removeWidget(self._central_widget)
+                central_layout.addWidget(widget)
+                self._central_widget = widget
+            finally:
+                container.setUpdatesEnabled(True)
 
     def dump_object_tree(self, obj: QObject, indent: int = 0):
         """
-        Recursively prints the QObject hierarchy starting from a given object.
+        Logs the QObject hierarchy starting from a given object (debug only).
         """
-        # Prepare the indentation string
-        indent_str = "  " * indent
+        if not LOGGER.isEnabledFor(logging.DEBUG):
+            return
 
-        # Get the widget's class name and object name
-        class_name = obj.metaObject().className()
-        object_name = obj.objectName()
+        lines = []
+        stack = [(obj, indent)]
+        while stack:
+            current, depth = stack.pop()
 
-        # Format the output string
-        line = f"{indent_str}- {class_name}"
-        if object_name:
-            line += f" (Name: '{object_name}')"
+            # Get the widget's class name and object name
+            class_name = current.metaObject().className()
+            object_name = current.objectName()
 
-        # Print the details for the current object
-        print(line)
+            # Format the output string
+            line = f"{'  ' * depth}- {class_name}"
+            if object_name:
+                line += f" (Name: '{object_name}')"
+            lines.append(line)
 
-        # Recursively call the function for all children
-        for child in obj.children():
-            self.dump_object_tree(child, indent + 1)
+            # Push children reversed so they come out in their natural order
+            stack.extend((child, depth + 1) for child in reversed(current.children()))
+
+        # Log the whole tree as one record
+        LOGGER.debug("Object tree:\n%s", "\n".join(lines))
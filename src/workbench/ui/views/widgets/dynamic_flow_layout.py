@@ -7,6 +7,8 @@ class DynamicFlowLayout(QLayout):
         super().__init__(parent)
         self._central_widget = None
         self._side_widget = None
+        # Side widget size hints per orientation, cleared on invalidate()
+        self._side_hints = {}
 
     def setCentralWidget(self, widget):
         self._central_widget = widget
@@ -44,6 +46,18 @@ class DynamicFlowLayout(QLayout):
         # A basic size hint, can be improved
         return QSize(400, 200)
 
+    def invalidate(self):
+        # Children changing their size hints end up here via updateGeometry()
+        self._side_hints.clear()
+        super().invalidate()
+
+    def _side_hint(self, orientation):
+        hint = self._side_hints.get(orientation)
+        if hint is None:
+            hint = self._side_widget.sizeHint()
+            self._side_hints[orientation] = hint
+        return hint
+
     def setGeometry(self, rect):
         """This is the core logic that rearranges the widgets."""
         super().setGeometry(rect)
@@ -58,7 +72,7 @@ class DynamicFlowLayout(QLayout):
             # Tell the control panel to use a VERTICAL layout
             self._side_widget.setOrientation(Qt.Orientation.Vertical)
 
-            side_width = self._side_widget.sizeHint().width()
+            side_width = self._side_hint(Qt.Orientation.Vertical).width()
             plot_rect = QRect(
                 rect.topLeft(), QSize(rect.width() - side_width, rect.height())
             )
@@ -73,7 +87,7 @@ class DynamicFlowLayout(QLayout):
             # Tell the control panel to use a HORIZONTAL layout
             self._side_widget.setOrientation(Qt.Orientation.Horizontal)
 
-            side_height = self._side_widget.sizeHint().height()
+            side_height = self._side_hint(Qt.Orientation.Horizontal).height()
             plot_rect = QRect(
                 rect.topLeft(), QSize(rect.width(), rect.height() - side_height)
             )
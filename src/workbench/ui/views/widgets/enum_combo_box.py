@@ -1,5 +1,5 @@
 from enum import Enum
-from PySide6.QtCore import Signal
+from PySide6.QtCore import Signal, Slot
 from PySide6.QtWidgets import QComboBox
 
 
@@ -59,6 +59,7 @@ class EnumComboBox(QComboBox):
         if index != -1:
             self.setCurrentIndex(index)
 
+    @Slot(int)
     def _emit_value_changed(self, index: int):
         """Internal slot to emit the custom valueChanged signal."""
         enum_member = self.itemData(index)
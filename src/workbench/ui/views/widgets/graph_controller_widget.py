@@ -1,4 +1,6 @@
+import functools
 import logging
+from collections import OrderedDict
 import numpy as np
 import pyqtgraph as pg
 import qtawesome as qta
@@ -10,10 +12,17 @@ from PySide6.QtCore import (
     QRect,
     QSize,
     Qt,
+    QTimer,
     Signal,
     Slot,
 )
-from PySide6.QtGui import QAction, QDoubleValidator, QIcon, QPainter
+from PySide6.QtGui import (
+    QAction,
+    QDoubleValidator,
+    QGuiApplication,
+    QIcon,
+    QPainter,
+)
 from PySide6.QtWidgets import (
     QComboBox,
     QLineEdit,
@@ -39,6 +48,26 @@ LOGGER = logging.getLogger(__name__)
 
 # LOGGER.setLevel("DEBUG")
 
+# Minimum time between two cursor refreshes (~60Hz)
+_CURSOR_REFRESH_INTERVAL_MS = 16
+
+# Number of tick label sets kept by each CustomLogAxis
+_TICK_CACHE_SIZE = 64
+
+
+@functools.lru_cache(maxsize=8)
+def _time_axis(n, fs):
+    """Returns a shared, read-only time axis of n samples at fs."""
+    x = np.arange(n, dtype=np.float64) / fs
+    x.flags.writeable = False
+    return x
+
+
+def _default_antialias():
+    """Antialiasing is costly on HiDPI screens, so it starts off there."""
+    screen = QGuiApplication.primaryScreen()
+    return screen is None or screen.devicePixelRatio() <= 1.0
+
 
 class Trigger:
     SLOPE_POSITIVE = "pos"
@@ -48,21 +77,38 @@ class Trigger:
         self.level = 0.5
         self.slope = Trigger.SLOPE_POSITIVE
         self.channel = 0
+        # Scratch buffers reused across frames, reallocated on size change
+        self._residual = None
+        self._wrong_slope = None
+
+    def _ensure_buffers(self, n):
+        if self._residual is None or len(self._residual) != n:
+            self._residual = np.empty(n, dtype=np.float64)
+            self._wrong_slope = np.empty(n, dtype=bool)
 
     def get_trigger_idx(self, data):
-        if self.level > np.max(np.abs(data[:, self.channel])):
+        x = np.ascontiguousarray(data[:, self.channel])
+        if len(x) == 0 or self.level > np.max(np.abs(x)):
             return 0
 
-        data_diff = np.diff(
-            data[:, self.channel], axis=0, prepend=data[0, self.channel]
-        )
-        data_slope = (
-            (data_diff < 0) if self.slope == self.SLOPE_POSITIVE else (data_diff > 0)
-        )
-        trigger_idx = np.argmin(
-            np.abs(data[:, self.channel] - self.level + data_slope * 10)
-        )
-        return trigger_idx
+        self._ensure_buffers(len(x))
+        residual = self._residual
+        wrong_slope = self._wrong_slope
+
+        # Distance of every sample to the trigger level
+        np.subtract(x, self.level, out=residual)
+        np.abs(residual, out=residual)
+
+        # Samples on the wrong slope can never be picked. The first sample
+        # has no predecessor, so its slope is taken as flat.
+        wrong_slope[0] = False
+        if self.slope == self.SLOPE_POSITIVE:
+            np.less(x[1:], x[:-1], out=wrong_slope[1:])
+        else:
+            np.greater(x[1:], x[:-1], out=wrong_slope[1:])
+        np.putmask(residual, wrong_slope, np.inf)
+
+        return int(residual.argmin())
 
 
 class CustomLogAxis(pg.AxisItem):
@@ -72,6 +118,8 @@ class CustomLogAxis(pg.AxisItem):
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
+        # (tick values, scale) -> formatted labels, least recently used first
+        self._tick_cache = OrderedDict()
 
     def logTickStrings(self, values, scale, spacing):
         """
@@ -81,8 +129,23 @@ class CustomLogAxis(pg.AxisItem):
         # You can call it as a fallback if needed:
         # return super().logTickStrings(values, scale, spacing)
 
+        # Ticks only change on zoom/pan, so repaints reuse the labels
+        key = (tuple(values), float(scale))
+        strings = self._tick_cache.get(key)
+        if strings is not None:
+            self._tick_cache.move_to_end(key)
+            return list(strings)
+
+        strings = self._format_log_ticks(values, scale)
+        self._tick_cache[key] = tuple(strings)
+        if len(self._tick_cache) > _TICK_CACHE_SIZE:
+            self._tick_cache.popitem(last=False)
+        return strings
+
+    @staticmethod
+    def _format_log_ticks(values, scale):
         # Custom implementation: Format ticks as "1k", "1M", etc.
-        lin_values = 10 ** np.array(values).astype(float) * np.array(scale)
+        lin_values = 10.0 ** np.asarray(values, dtype=np.float64) * scale
         strings = []
         for v in lin_values:
             if v == 0:
@@ -123,7 +186,8 @@ class GraphControllerWidget(QWidget):
     def __init__(self, parent=None) -> None:
         super().__init__(parent)
 
-        pg.setConfigOptions(antialias=True, background=None)
+        self._antialias = _default_antialias()
+        pg.setConfigOptions(antialias=self._antialias, background=None)
 
         self._flow_layout = DynamicFlowLayout(self)
         self._control_panel = ControlPanelWidget(self)
@@ -169,11 +233,20 @@ class GraphControllerWidget(QWidget):
         else:
             self._trigger_neg_slope_action.setChecked(True)
 
+        # Cursor moves from both cursors are handled together, at most
+        # once per display frame
+        self._cursor_refresh = QTimer(self)
+        self._cursor_refresh.setSingleShot(True)
+        self._cursor_refresh.setInterval(_CURSOR_REFRESH_INTERVAL_MS)
+        self._cursor_refresh.timeout.connect(self._process_cursor_updates)
+
         self._cursor1 = GraphCursor("Cursor 1", self._plot, color="green", width=2)
         self._cursor1.cursor_changed.connect(self._cursor_changed)
+        self._cursor1.update_requested.connect(self._schedule_cursor_refresh)
 
         self._cursor2 = GraphCursor("Cursor 2", self._plot, color="blue", width=2)
         self._cursor2.cursor_changed.connect(self._cursor_changed)
+        self._cursor2.update_requested.connect(self._schedule_cursor_refresh)
 
         # self._side_panel_layout.addWidget(self._cursor1.create_panel())
         # self._side_panel_layout.addWidget(self._cursor2.create_panel())
@@ -221,7 +294,11 @@ class GraphControllerWidget(QWidget):
                 name=media_info.channels[ch].name,
                 pen=pg.mkPen(pg.intColor(i), width=1),
                 autoDownsample=True,
+                # Keep min/max per pixel so dense waveforms keep their peaks
+                downsampleMethod="peak",
+                clipToView=True,
                 skipFiniteCheck=True,
+                antialias=self._antialias,
             )
             for i, ch in enumerate(self._active_channels)
         ]
@@ -229,7 +306,7 @@ class GraphControllerWidget(QWidget):
         if xaxis_log:
             self._plot.setLogMode(x=True, y=False)
 
-        self._x = np.arange(block_size) / media_info.samplerate
+        self._x = _time_axis(block_size, media_info.samplerate)
         self._buf = MediaRingBuffer(
             capacity=2 * block_size, dtype=media_info.dtype, allow_overwrite=False
         )
@@ -293,6 +370,16 @@ class GraphControllerWidget(QWidget):
     def _set_yrange(self, min, max):
         self._plot.setYRange(min, max)
 
+    @Slot()
+    def _schedule_cursor_refresh(self):
+        if not self._cursor_refresh.isActive():
+            self._cursor_refresh.start()
+
+    @Slot()
+    def _process_cursor_updates(self):
+        self._cursor1.process_pending_update()
+        self._cursor2.process_pending_update()
+
     def _cursor_changed(self, values):
         print(f"{self.sender().name}: {values}")
 
@@ -326,6 +413,13 @@ class GraphControllerWidget(QWidget):
         button_action.triggered.connect(self.onMyToolBarButtonClick)
         self._toolbar.addAction(button_action)
 
+        antialias_action = QAction(qta.icon("mdi6.blur"), "Antialiasing", self)
+        antialias_action.setCheckable(True)
+        antialias_action.setChecked(self._antialias)
+        antialias_action.setStatusTip("Smooth the curves (slower on HiDPI screens)")
+        antialias_action.toggled.connect(self.set_antialiasing)
+        self._toolbar.addAction(antialias_action)
+
         self._toolbar.addSeparator()
 
         # Y-Axis Scale controls
@@ -461,12 +555,12 @@ class GraphControllerWidget(QWidget):
             LOGGER.debug(f"Port '{port}' format changed: '{media_info}'")
             self.configure_graph(media_info, False)
 
-    @Slot(str, object)
-    def on_data_received(self, port, data):
+    @Slot(str, object, object)
+    def on_data_received(self, port, x_data, y_data):
         if self.sender() != self._view_model:
             return
 
-        LOGGER.debug(f"Port '{port}' received {len(data)} samples")
+        LOGGER.debug("Port '%s' received %d samples", port, y_data.shape[-1])
         self._update_perf.mark_start()
 
         # self._buf.extend(data)
@@ -481,12 +575,12 @@ class GraphControllerWidget(QWidget):
         #    for i, ch in enumerate(self._active_channels):
         #        self._curves[i].setData(self._x, show_data[:, ch])
 
-        x_data = data["x_data"]
-        y_data = data["y_data"]
+        # y_data is channel-major, so every row is already contiguous
         for i, ch in enumerate(self._active_channels):
-            self._curves[i].setData(x_data, y_data[:, ch])
+            self._curves[i].setData(x_data, y_data[ch])
 
-        self._plot.setLimits(xMin=np.min(x_data), xMax=np.max(x_data))
+        # x is sorted, so its limits are its end points
+        self._plot.setLimits(xMin=float(x_data[0]), xMax=float(x_data[-1]))
 
         self._update_perf.mark_stop()
 
@@ -516,6 +610,16 @@ class GraphControllerWidget(QWidget):
     # def set_yrange(self, min_val, max_val):
     #    self._yrange.set_manual_range(min_val, max_val)
 
+    @Slot(bool)
+    def set_antialiasing(self, enabled):
+        self._antialias = enabled
+        self._plot.setAntialiasing(enabled)
+        for curve in self._curves or ():
+            # The data item hands its opts to the curve on every setData
+            curve.opts["antialias"] = enabled
+            curve.curve.opts["antialias"] = enabled
+            curve.curve.update()
+
     def set_trigger_mode(self, new_mode: bool):
         self._trigger_enabled = new_mode
         self._trigger_bar.setVisible(new_mode)
@@ -10,6 +10,9 @@ LOGGER = logging.getLogger(__name__)
 
 class GraphCursor(QObject):
     cursor_changed = Signal(list)
+    # Emitted once when the cursor moves and has no update pending; the
+    # owner calls process_pending_update() when it is ready to redraw
+    update_requested = Signal()
 
     def __init__(self, name, plot, channel=0, color=None, width=None) -> None:
         super().__init__()
@@ -22,23 +25,26 @@ class GraphCursor(QObject):
         self._plot = plot
         self._channel = channel
         self._channels = self._get_channels_from_plot()
-        self._vline = pg.InfiniteLine(
-            angle=90, movable=True, pen=pg.mkPen(color, width=width)
-        )
-        self._hline = pg.InfiniteLine(
-            angle=0, movable=False, pen=pg.mkPen(color, width=width)
-        )
+        # Both lines are drawn with the same pen settings
+        pen = pg.mkPen(color, width=width)
+        self._vline = pg.InfiniteLine(angle=90, movable=True, pen=pen)
+        self._hline = pg.InfiniteLine(angle=0, movable=False, pen=pen)
         self._plot.addItem(self._vline, ignoreBounds=True)
         self._plot.addItem(self._hline, ignoreBounds=True)
 
         # self._plot.scene().sigMouseMoved.connect(self.update_position)
         # self._sig_proxy = pg.SignalProxy(self._plot.scene().sigMouseMoved, rateLimit=60, slot=self.update_position)
-        self._sig_proxy = pg.SignalProxy(
-            self._vline.sigPositionChanged, rateLimit=60, slot=self.vline_pos_changed
-        )
+        # Moves only mark the cursor dirty, the owner drains them on a timer.
+        # The line is only listened to while the cursor is active.
+        self._update_pending = False
+        self._active = False
         self._x_is_log = False
         self._y_is_log = False
         self._ch_combo = None
+        # PlotDataItem of the selected channel, resolved on channel changes
+        self._active_plot_item = None
+        # (x, y) currently written in the panel labels
+        self._shown_coordinates = None
 
         self.set_active(True)
         self._setup_panel()
@@ -87,8 +93,21 @@ class GraphCursor(QObject):
         print(channels)
         return channels
 
+    def _resolve_plot_item(self):
+        plot_data = None
+        i = 0
+        for plot_item in self._plot.listDataItems():
+            if isinstance(plot_item, pg.PlotDataItem):
+                plot_data = plot_item
+                if i == self._channel:
+                    break
+                else:
+                    i += 1
+        self._active_plot_item = plot_data
+
     def update_channels(self):
         self._channels = self._get_channels_from_plot()
+        self._resolve_plot_item()
         self._update_chcombo()
         x_is_log, y_is_log = self._plot.getViewBox().state["logMode"]
         self._x_is_log = x_is_log
@@ -97,11 +116,34 @@ class GraphCursor(QObject):
         LOGGER.debug("Channels updated")
 
     def set_active(self, new_state):
+        if new_state != self._active:
+            if new_state:
+                self._vline.sigPositionChanged.connect(self._on_vline_moved)
+            else:
+                self._vline.sigPositionChanged.disconnect(self._on_vline_moved)
+                self._update_pending = False
         self._active = new_state
         self._vline.setVisible(new_state)
         self._hline.setVisible(new_state)
 
+    def _on_vline_moved(self, line):
+        if self._update_pending:
+            return
+        self._update_pending = True
+        self.update_requested.emit()
+
+    def process_pending_update(self):
+        """Refreshes the cursor value if it moved since the last call."""
+        if not self._update_pending:
+            return
+        self._update_pending = False
+        if self._vline.isVisible():
+            self.vline_pos_changed([self._vline])
+
     def vline_pos_changed(self, e):
+        if not self._active:
+            return
+
         line = e[0]
         x_pos = line.pos()[0]
         try:
@@ -135,16 +177,7 @@ class GraphCursor(QObject):
             # self._hline.setPos(mousePoint.y())
 
     def get_value_from_xcoordinate(self, coord):
-        plot_data = None
-        i = 0
-        for plot_item in self._plot.listDataItems():
-            if isinstance(plot_item, pg.PlotDataItem):
-                plot_data = plot_item
-                if i == self._channel:
-                    break
-                else:
-                    i += 1
-
+        plot_data = self._active_plot_item
         if plot_data is None:
             return None
             raise RuntimeError("PlotDataItem not found")
@@ -153,14 +186,21 @@ class GraphCursor(QObject):
         if ds is None or ds[0] is None or ds[1] is None:
             raise RuntimeError("No dataset found in plot")
 
-        if self._x_is_log:
-            print(ds[0])
-            idx = (np.abs(ds[0] - np.pow(10, coord))).argmin()
-        else:
-            idx = (np.abs(ds[0] - coord)).argmin()
-        # print(f"idx: {idx}, x: {ds[0][idx]}, y: {ds[1][idx]}")
+        # In log mode the view coordinate is log10(x)
+        target = 10.0**coord if self._x_is_log else coord
+        idx = self._nearest_index(ds[0], target)
+        LOGGER.debug("idx: %s, x: %s, y: %s", idx, ds[0][idx], ds[1][idx])
         return (ds[0][idx], ds[1][idx])
 
+    def _nearest_index(self, x, target):
+        """Returns the index of the x value closest to target."""
+        # Every x-axis the view model produces is ascending, so a binary
+        # search finds the insertion point; then pick the closer neighbour
+        idx = min(int(np.searchsorted(x, target)), len(x) - 1)
+        if idx > 0 and abs(x[idx - 1] - target) <= abs(x[idx] - target):
+            idx -= 1
+        return idx
+
     def update_panel(self):
         # This method can be called many times.
 
@@ -245,8 +285,15 @@ class GraphCursor(QObject):
 
     def _channel_change(self, idx):
         self._channel = idx
+        self._resolve_plot_item()
         self.vline_pos_changed([self._vline])
 
     def update_panel_coordinates(self):
+        # Dragging along a flat region or between two samples keeps landing
+        # on the same point; skip the formatting and relayout then
+        shown = (self._x, self._y)
+        if shown == self._shown_coordinates:
+            return
+        self._shown_coordinates = shown
         self._x_label.setText(f"x: {EngNumber(self._x)}")
         self._y_label.setText(f"y: {EngNumber(self._y)}")
@@ -21,19 +21,49 @@ class LegendSelect(QtCore.QObject):
 
         def __init__(self, pen, box_bg_color, box_width, box_height, parent=None):
             super().__init__(parent=parent)
-            self.pen = pen
+            # Rendered box, rebuilt when the pen or the size changes
+            self._cache: QtGui.QPixmap | None = None
+            self._pen = pen
             self.box_bg_color = box_bg_color
             self.setFixedSize(box_width, box_height)
 
-        def paintEvent(self, _event):
+        @property
+        def pen(self):
+            return self._pen
+
+        @pen.setter
+        def pen(self, pen):
+            self._pen = pen
+            self._cache = None
+            self.update()
+
+        def _render(self):
             w = self.width()
             h = self.height()
             x_offset, y_offset = 8, 6
 
+            ratio = self.devicePixelRatioF()
+            pixmap = QtGui.QPixmap(self.size() * ratio)
+            pixmap.setDevicePixelRatio(ratio)
+
+            painter = QtGui.QPainter(pixmap)
+            painter.fillRect(0, 0, w, h, self.box_bg_color)
+            if self._pen is not None:
+                painter.setPen(self._pen)
+                painter.drawLine(x_offset, h - y_offset, w - x_offset, y_offset)
+            painter.end()
+            return pixmap
+
+        def paintEvent(self, _event):
+            if (
+                self._cache is None
+                or self._cache.deviceIndependentSize().toSize() != self.size()
+                or self._cache.devicePixelRatio() != self.devicePixelRatioF()
+            ):
+                self._cache = self._render()
+
             painter = QtGui.QPainter(self)
-            painter.fillRect(self.rect(), self.box_bg_color)
-            painter.setPen(self.pen)
-            painter.drawLine(x_offset, h - y_offset, w - x_offset, y_offset)
+            painter.drawPixmap(0, 0, self._cache)
             painter.end()
 
     def __init__(
@@ -55,6 +85,9 @@ class LegendSelect(QtCore.QObject):
         self._linked_curves: List[pg.PlotDataItem] = []
         self.chkbs: List[QtWidgets.QCheckBox] = []
         self.painted_boxes: List[LegendSelect.PaintedBox] = []
+        # Every (checkbox, painted box) row created so far. Rows are reused
+        # across updates and hidden when there are fewer curves.
+        self._rows: List[tuple] = []
 
         # --- Setup persistent UI elements (that don't change) ---
         # Main widget and its layout
@@ -65,9 +98,11 @@ class LegendSelect(QtCore.QObject):
 
         # A container for the dynamically generated curve rows
         self._curves_widget = QtWidgets.QWidget()
-        self._curves_layout = QtWidgets.QVBoxLayout(self._curves_widget)
+        # One grid for all rows: checkbox on the left, pen box on the right
+        self._curves_layout = QtWidgets.QGridLayout(self._curves_widget)
         self._curves_layout.setContentsMargins(0, 0, 0, 0)
         self._curves_layout.setSpacing(1)
+        self._curves_layout.setColumnStretch(0, 1)
 
         # The "No Data" label
         self._lbl_no_data = QtWidgets.QLabel("No Data Series")
@@ -88,68 +123,71 @@ class LegendSelect(QtCore.QObject):
         # Set the initial empty state
         self.update([])
 
-    def _clear_layout(self, layout):
-        """Recursively clears all widgets and sub-layouts from a layout."""
-        if layout is None:
-            return
-        # Iterate backwards to safely remove items
-        while layout.count():
-            item = layout.takeAt(0)
-            widget = item.widget()
-            if widget is not None:
-                # If the item is a widget, schedule it for deletion
-                widget.deleteLater()
-            else:
-                # If the item is a nested layout, clear it recursively
-                self._clear_layout(item.layout())
+    def _add_row(self):
+        """Creates a new, empty legend row and appends it to the pool."""
+        chkb = QtWidgets.QCheckBox()
+        chkb.clicked.connect(self._updateVisibility)
+
+        painted_box = self.PaintedBox(
+            pen=None,
+            box_bg_color=self._box_bg_color,
+            box_width=self._box_width,
+            box_height=self._box_height,
+        )
+
+        row_index = len(self._rows)
+        self._curves_layout.addWidget(
+            chkb, row_index, 0, alignment=Qt.AlignmentFlag.AlignLeft
+        )
+        self._curves_layout.addWidget(
+            painted_box, row_index, 1, alignment=Qt.AlignmentFlag.AlignRight
+        )
+
+        row = (chkb, painted_box)
+        self._rows.append(row)
+        return row
 
     def update(self, linked_curves: Sequence[pg.PlotDataItem]):
         """
-        Clears the old legend and rebuilds it with a new list of curves.
+        Updates the legend to show a new list of curves.
+
+        Existing rows are reused; rows are only created when the legend
+        grows and hidden when it shrinks.
 
         Args:
             linked_curves: A new sequence of pyqtgraph.PlotDataItem instances.
         """
         self._linked_curves = linked_curves
-
-        # --- Clear all dynamically created widgets ---
-        self.chkbs.clear()
-        self.painted_boxes.clear()
-        self._clear_layout(self._curves_layout)
+        count = len(linked_curves)
 
         # --- Handle state based on whether curves exist ---
-        if not self._linked_curves:
+        if not count:
             self._lbl_no_data.show()
             self._curves_widget.hide()
             self.qpbt_toggle.hide()
-            return
-
-        self._lbl_no_data.hide()
-        self._curves_widget.show()
-        if not self.qpbt_toggle.isHidden():
-            self.qpbt_toggle.show()
-
-        # --- Rebuild the legend with the new curves ---
-        for curve in self._linked_curves:
-            chkb = QtWidgets.QCheckBox(curve.name())
+        else:
+            self._lbl_no_data.hide()
+            self._curves_widget.show()
+            if not self.qpbt_toggle.isHidden():
+                self.qpbt_toggle.show()
+
+        # --- Fill the rows with the new curves ---
+        while len(self._rows) < count:
+            self._add_row()
+
+        for curve, (chkb, painted_box) in zip(linked_curves, self._rows):
+            chkb.setText(curve.name())
             chkb.setChecked(curve.isVisible())
-            chkb.clicked.connect(self._updateVisibility)
-            self.chkbs.append(chkb)
+            chkb.show()
+            painted_box.pen = curve.opts["pen"]
+            painted_box.show()
 
-            painted_box = self.PaintedBox(
-                pen=curve.opts["pen"],
-                box_bg_color=self._box_bg_color,
-                box_width=self._box_width,
-                box_height=self._box_height,
-            )
-            self.painted_boxes.append(painted_box)
+        for chkb, painted_box in self._rows[count:]:
+            chkb.hide()
+            painted_box.hide()
 
-            # Create a layout for each row
-            row_layout = QtWidgets.QHBoxLayout()
-            row_layout.addWidget(chkb)
-            row_layout.addStretch()
-            row_layout.addWidget(painted_box)
-            self._curves_layout.addLayout(row_layout)
+        self.chkbs = [chkb for chkb, _ in self._rows[:count]]
+        self.painted_boxes = [painted_box for _, painted_box in self._rows[:count]]
 
     @Slot()
     def _updateVisibility(self):
@@ -253,9 +291,7 @@ class LegendSelect2(QtCore.QObject):
             chkb.setChecked(curve.isVisible())
             chkb.setLayoutDirection(Qt.LayoutDirection.LeftToRight)
             self.chkbs.append(chkb)
-            # fmt: off
-            chkb.clicked.connect(lambda: self._updateVisibility())  # pylint: disable=unnecessary-lambda
-            # fmt: on
+            chkb.clicked.connect(self._updateVisibility)
 
             painted_box = self.PaintedBox(
                 pen=curve.opts["pen"],
@@ -300,29 +336,5 @@ class LegendSelect2(QtCore.QObject):
 
         self._updateVisibility()
 
-    class PaintedBox(QtWidgets.QWidget):
-        """GUI element belonging to ``LegendSelect()``. Draws a rectangle with a
-        line drawn inside according to the passed pen settings. This is used to
-        build up the rows of the legend."""
-
-        def __init__(self, pen, box_bg_color, box_width, box_height, parent=None):
-            super().__init__(parent=parent)
-
-            self.pen = pen
-            self.box_bg_color = box_bg_color
-
-            self.setFixedWidth(box_width)
-            self.setFixedHeight(box_height)
-
-        def paintEvent(self, _event):
-            w = self.width()
-            h = self.height()
-            x = 8  # offset line
-            y = 6  # offset line
-
-            painter = QtGui.QPainter()
-            painter.begin(self)
-            painter.fillRect(0, 0, w, h, self.box_bg_color)
-            painter.setPen(self.pen)
-            painter.drawLine(QtCore.QLine(x, h - y, w - x, y))
-            painter.end()
+    # Same box as LegendSelect's, including its cached rendering
+    PaintedBox = LegendSelect.PaintedBox
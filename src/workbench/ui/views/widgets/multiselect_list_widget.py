@@ -1,13 +1,11 @@
 from enum import Enum
-from PySide6.QtCore import Signal, Qt
+from PySide6.QtCore import Signal, Slot, Qt
 from PySide6.QtWidgets import QListWidget, QListWidgetItem
 
 import logging
 
 LOGGER = logging.getLogger(__name__)
 
-LOGGER.setLevel("DEBUG")
-
 class MultiSelectListWidget(QListWidget):
     """
     A QListWidget subclass that allows multiple selections and
@@ -33,13 +31,21 @@ class MultiSelectListWidget(QListWidget):
 
     def populate_from_list(self, items: list[str]):
         """Clears the list widget and fills it with string items."""
-        self.clear()
-        for item in items:
-            itm = QListWidgetItem(item)
-            itm.setFlags(itm.flags() | Qt.ItemIsUserCheckable)
-            itm.setCheckState(Qt.Unchecked)
-            self.addItem(itm)
-        #self.addItems(items)
+        # Rebuild with painting off so the list repaints once at the end.
+        # Signals stay connected: clear() may change the selection, which
+        # must still be reported; items are fully set up before being
+        # added, so adding them emits nothing.
+        self.setUpdatesEnabled(False)
+        try:
+            self.clear()
+            for item in items:
+                itm = QListWidgetItem(item)
+                itm.setFlags(itm.flags() | Qt.ItemIsUserCheckable)
+                itm.setCheckState(Qt.Unchecked)
+                self.addItem(itm)
+            #self.addItems(items)
+        finally:
+            self.setUpdatesEnabled(True)
 
     def items(self) -> list[str]:
         """
@@ -75,49 +81,67 @@ class MultiSelectListWidget(QListWidget):
 
     def get_value(self) -> str:
         """Returns the currently selected items as a single delimited string."""
-        selected_items = self.selectedIndexes()
-        str_list = [str(item.row()) for item in selected_items]
-        return self._separator.join(str_list)
+        # Sorted, so the same selection always gives the same string
+        rows = sorted(index.row() for index in self.selectedIndexes())
+        return self._separator.join(map(str, rows))
 
     def set_value(self, value: str):
         """Sets the current selection based on a single delimited string."""
-        
-        # 1. Clear the current selection
-        self.clearSelection()
 
-        # 2. Create a set of the string values to select
+        # 1. Create a set of the string values to select
         if not value:
-            items_to_select = set()
-        elif type(value) == str:
-            items_to_select = set([int(x) for x in value.split(self._separator)])
-        elif type(value) == list:
-            items_to_select = set(value)
+            items_to_select = frozenset()
+        elif isinstance(value, str):
+            items_to_select = frozenset(map(int, value.split(self._separator)))
+        elif isinstance(value, list):
+            items_to_select = frozenset(value)
         else:
-            items_to_select = set()
-
-        LOGGER.debug(f"items_to_select: {items_to_select}")
-        # 3. Iterate over all items and select the ones in the set
-        for i in range(self.count()):
-            item = self.item(i)
-            #if item.text() in items_to_select:
-            #    item.setSelected(True)
-            if i in items_to_select:
-                item.setSelected(True)
-
+            items_to_select = frozenset()
+
+        LOGGER.debug("items_to_select: %s", items_to_select)
+        # 2. Replace the selection, visiting only the rows to select. Each
+        # change would report the selection again, so it is reported once
+        # at the end instead.
+        count = self.count()
+        self.blockSignals(True)
+        try:
+            self.clearSelection()
+            for i in items_to_select:
+                if 0 <= i < count:
+                    self.item(i).setSelected(True)
+        finally:
+            self.blockSignals(False)
+        self._emit_value_changed()
+
+    @Slot(QListWidgetItem)
     def _item_changed(self, item):
         if item.checkState() == Qt.Checked:
             item.setSelected(True)
         else:
             item.setSelected(False)
 
+    @Slot()
     def _emit_value_changed(self):
         """Internal slot to emit the custom valueChanged signal."""
-        for index in range(self.count()):
-            item = self.item(index)
-            if item.isSelected():
-                item.setCheckState(Qt.Checked)
-            else:
-                item.setCheckState(Qt.Unchecked)
+        # Mirroring the selection into the check boxes would otherwise run
+        # _item_changed once per item, only to re-apply the same selection
+        # The selected rows are collected on the way, in the same order
+        # get_value() would return them
+        rows = []
+        self.blockSignals(True)
+        try:
+            for index in range(self.count()):
+                item = self.item(index)
+                if item.isSelected():
+                    rows.append(index)
+                    check_state = Qt.Checked
+                else:
+                    check_state = Qt.Unchecked
+                # Only touch the items whose state actually changes
+                if item.checkState() != check_state:
+                    item.setCheckState(check_state)
+        finally:
+            self.blockSignals(False)
         # This signal is emitted whenever selection changes
-        current_value_str = self.get_value()
+        current_value_str = self._separator.join(map(str, rows))
         self.value_changed.emit(self._name, current_value_str)
@@ -16,8 +16,6 @@ from ...viewmodels.scope_viewmodel import ScopeViewModel
 
 LOGGER = logging.getLogger(__name__)
 
-LOGGER.setLevel("DEBUG")
-
 
 class ScaleControlWidget(QWidget):
     """
@@ -130,9 +128,7 @@ class ScaleControlWidget(QWidget):
         # When the user clicks a button, update the ViewModel's mode property.
         self.button_group.buttonClicked.connect(self._on_mode_button_clicked)
 
-        # When the user changes a spinbox, update the ViewModel's manual properties.
-        self._min_spinbox.valueChanged.connect(self._on_manual_limits_changed)
-        self._max_spinbox.valueChanged.connect(self._on_manual_limits_changed)
+        # The spinboxes are connected to _on_manual_limits_changed in _build_ui
 
     @Slot()
     def on_view_model_state_updated(self):
@@ -143,24 +139,30 @@ class ScaleControlWidget(QWidget):
         LOGGER.debug("updating state from view_model")
         # Update which mode button is checked
         current_mode = self.view_model.get_property("vertical_scale_mode")
-        LOGGER.debug(f"ViewModel scale_mode: {current_mode}")
-        for button in self.button_group.buttons():
-            LOGGER.debug(f"buttons mode: {button.property('scale_mode')}")
-            if button.property("scale_mode") == current_mode:
-                button.setChecked(True)
-                break
+        LOGGER.debug("ViewModel scale_mode: %s", current_mode)
+        checked = self.button_group.checkedButton()
+        if checked is None or checked.property("scale_mode") != current_mode:
+            for button in self.button_group.buttons():
+                LOGGER.debug("buttons mode: %s", button.property("scale_mode"))
+                if button.property("scale_mode") == current_mode:
+                    button.setChecked(True)
+                    break
 
         # Update visibility and values of manual controls
         is_manual = current_mode == ScaleMode.MANUAL
         self._manual_container.setEnabled(is_manual)
 
-        # Block signals to prevent feedback loops while setting values
-        self._min_spinbox.blockSignals(True)
-        self._max_spinbox.blockSignals(True)
-        self._min_spinbox.setValue(self.view_model.get_property("vertical_scale_min"))
-        self._max_spinbox.setValue(self.view_model.get_property("vertical_scale_max"))
-        self._min_spinbox.blockSignals(False)
-        self._max_spinbox.blockSignals(False)
+        # Block signals to prevent feedback loops while setting values, and
+        # skip values that are already shown (e.g. echoes of our own edits)
+        for spinbox, name in (
+            (self._min_spinbox, "vertical_scale_min"),
+            (self._max_spinbox, "vertical_scale_max"),
+        ):
+            value = self.view_model.get_property(name)
+            if abs(spinbox.value() - value) > 1e-9:
+                spinbox.blockSignals(True)
+                spinbox.setValue(value)
+                spinbox.blockSignals(False)
 
     @Slot(QPushButton)
     def _on_mode_button_clicked(self, button):
@@ -173,6 +175,14 @@ class ScaleControlWidget(QWidget):
     def _on_manual_limits_changed(self):
         """Pushes the spinbox values to the ViewModel."""
         LOGGER.debug("Updating view_model property")
-        # We must set both properties, even if only one changed.
-        self.view_model.update_property("vertical_scale_min", self._min_spinbox.value())
-        self.view_model.update_property("vertical_scale_max", self._max_spinbox.value())
+        # Only push the limit that was edited; each update makes the model
+        # notify its listeners, so writing both would double the round trips
+        sender = self.sender()
+        if sender is not self._max_spinbox:
+            self.view_model.update_property(
+                "vertical_scale_min", self._min_spinbox.value()
+            )
+        if sender is not self._min_spinbox:
+            self.view_model.update_property(
+                "vertical_scale_max", self._max_spinbox.value()
+            )
@@ -26,4 +26,9 @@ DEFAULT_LOGGING = {
 
 
 def configure_logger():
+    # The format uses neither the process nor the asyncio task, so don't
+    # collect them for every record
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+    logging.logAsyncioTasks = False
     logging.config.dictConfig(DEFAULT_LOGGING)
@@ -1,16 +1,57 @@
+import math
 from time import perf_counter
-from dvg_ringbuffer import RingBuffer
 import numpy as np
 from .singleton import SingletonMeta
-from engineering_notation import EngNumber
+
+# SI prefixes from 1e-12 to 1e9, indexed by (exponent / 3) + 4
+_SI_PREFIXES = ("p", "n", "u", "m", "", "k", "M", "G")
+
+
+def _format_eng(value) -> str:
+    """Formats a number with an SI prefix, e.g. 0.00123 -> '1.23m'."""
+    if isinstance(value, str):
+        return value
+    value = float(value)
+    if value == 0.0 or not math.isfinite(value):
+        return f"{value:g}"
+    exp3 = math.floor(math.log10(abs(value)) / 3)
+    exp3 = max(-4, min(3, exp3))
+    return f"{value / 1000.0**exp3:.2f}{_SI_PREFIXES[exp3 + 4]}"
+
+
+class _TimestampRing:
+    """Fixed-size ring of float64 timestamps, overwriting the oldest."""
+
+    def __init__(self, size) -> None:
+        self._buf = np.empty(size, dtype=np.float64)
+        self._size = size
+        self._idx = 0
+        self._count = 0
+
+    def append(self, value) -> None:
+        self._buf[self._idx] = value
+        self._idx += 1
+        if self._idx == self._size:
+            self._idx = 0
+        if self._count < self._size:
+            self._count += 1
+
+    def __len__(self) -> int:
+        return self._count
+
+    def ordered(self) -> np.ndarray:
+        """Returns the stored timestamps, oldest first."""
+        if self._count < self._size:
+            return self._buf[: self._count]
+        return np.concatenate((self._buf[self._idx :], self._buf[: self._idx]))
 
 
 class PerformanceTimer:
     def __init__(self, name, buffer_size=1024) -> None:
         self.name = name
         self.buffer_size = buffer_size
-        self.start_buf = RingBuffer(buffer_size)
-        self.stop_buf = RingBuffer(buffer_size)
+        self.start_buf = _TimestampRing(buffer_size)
+        self.stop_buf = _TimestampRing(buffer_size)
 
     def mark_start(self) -> None:
         self.start_buf.append(perf_counter())
@@ -20,22 +61,31 @@ class PerformanceTimer:
 
     def get_stats(self) -> dict:
         stats = {}
-        if len(self.start_buf) > 0:
-            stats["start"] = self._calulate_stats(np.diff(self.start_buf))
-        if len(self.stop_buf) > 0:
-            stats["stop"] = self._calulate_stats(np.diff(self.stop_buf))
-        if len(self.start_buf) == len(self.stop_buf):
-            stats["diff"] = self._calulate_stats(
-                np.subtract(self.stop_buf, self.start_buf)
-            )
+        # Unwrap each ring buffer once and reuse it for every group
+        starts = self.start_buf.ordered()
+        stops = self.stop_buf.ordered()
+        if len(starts) > 0:
+            stats["start"] = self._calulate_stats(np.subtract(starts[1:], starts[:-1]))
+        if len(stops) > 0:
+            stats["stop"] = self._calulate_stats(np.subtract(stops[1:], stops[:-1]))
+        if len(starts) == len(stops):
+            stats["diff"] = self._calulate_stats(np.subtract(stops, starts))
         return stats
 
     def _calulate_stats(self, data) -> dict:
         stats = {}
-        stats["mean"] = np.mean(data) if len(data) > 0 else "N/A"
-        stats["min"] = np.min(data) if len(data) > 0 else "N/A"
-        stats["max"] = np.max(data) if len(data) > 0 else "N/A"
-        stats["std"] = np.std(data) if len(data) > 0 else "N/A"
+        n = len(data)
+        if n == 0:
+            return {"mean": "N/A", "min": "N/A", "max": "N/A", "std": "N/A"}
+
+        # The std is derived from the same sums as the mean (E[x^2] - E[x]^2)
+        # instead of running np.std as another two passes
+        mean = data.sum() / n
+        mean_sq = np.dot(data, data) / n
+        stats["mean"] = mean
+        stats["min"] = data.min()
+        stats["max"] = data.max()
+        stats["std"] = np.sqrt(max(mean_sq - mean * mean, 0.0))
         return stats
 
     def __str__(self) -> str:
@@ -45,7 +95,7 @@ class PerformanceTimer:
             tmp += f"{group_key}\n    "
             tmp += (
                 ", ".join(
-                    [f"{key}: {EngNumber(value)}" for key, value in group.items()]
+                    [f"{key}: {_format_eng(value)}" for key, value in group.items()]
                 )
                 + "\n  "
             )
@@ -55,12 +105,12 @@ class PerformanceTimer:
 
 class PerformanceMonitorService(metaclass=SingletonMeta):
     def __init__(self) -> None:
-        self.timers = {}
+        self.timers: list[PerformanceTimer] = []
         print("PerformanceMonitorService Created")
 
     def new_timer(self, name, buffer_size=1024) -> PerformanceTimer:
         timer = PerformanceTimer(name, buffer_size)
-        self.timers[timer] = timer
+        self.timers.append(timer)
         return timer
 
     def dump(self) -> None: